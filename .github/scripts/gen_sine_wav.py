@@ -6,18 +6,47 @@ import math
 import wave
 import struct
 
+try:
+    import numpy as np
+except ImportError:  # 未安装 numpy 时退回纯 Python 实现
+    np = None
+
+# 预编译的 16-bit 小端打包器，避免每个样本重复解析格式串
+_PCM16 = struct.Struct("<h")
+# 递推合成时每隔多少个样本用 math.sin 重新校准
+_RESEED_EVERY = 10000
+
+def synth_numpy(n_samples: int, sr: int, freq: float) -> bytes:
+    # 一次性向量化生成全部采样点，避免逐样本调用 sin/struct.pack/writeframes
+    t = np.arange(n_samples, dtype=np.float64) / sr
+    samples = (0.2 * np.sin(2 * np.pi * freq * t) * 32767).astype("<i2")  # 0.2 防止削波
+    return samples.tobytes()
+
+def synth_python(n_samples: int, sr: int, freq: float) -> bytes:
+    # 预分配输出缓冲区，通过 pack_into 原地写入，最后一次性交给 writeframes
+    buf = bytearray(_PCM16.size * n_samples)
+    pack_into = _PCM16.pack_into
+    omega = 2 * math.pi * freq / sr
+    c1 = 2 * math.cos(omega)
+    # 二阶递推 s[n+1] = c1*s[n] - s[n-1]，每个样本只需一次乘法与一次减法
+    for i in range(n_samples):
+        if i % _RESEED_EVERY == 0:
+            # 定期用 sin 重新校准，限制浮点误差累积
+            s0, s1 = math.sin(omega * i), math.sin(omega * (i + 1))
+        pack_into(buf, 2 * i, int(0.2 * s0 * 32767))  # 0.2 防止削波
+        s0, s1 = s1, c1 * s1 - s0
+    return bytes(buf)
+
 def main(out_path: str, sr: int = 16000, freq: float = 440.0, seconds: float = 1.5):
     out = Path(out_path)
     out.parent.mkdir(parents=True, exist_ok=True)
     n_samples = int(sr * seconds)
+    frames = synth_numpy(n_samples, sr, freq) if np is not None else synth_python(n_samples, sr, freq)
     with wave.open(str(out), "wb") as wf:
         wf.setnchannels(1)
         wf.setsampwidth(2)  # 16-bit PCM
         wf.setframerate(sr)
-        for i in range(n_samples):
-            t = i / sr
-            val = 0.2 * math.sin(2 * math.pi * freq * t)  # 0.2 防止削波
-            wf.writeframes(struct.pack("<h", int(val * 32767)))
+        wf.writeframes(frames)
     print(f"[gen_wav] wrote {out} ({seconds}s @ {sr}Hz)")
 
 if __name__ == "__main__":
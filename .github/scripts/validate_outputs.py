@@ -1,30 +1,71 @@
 # 只做结构级校验：确保 out/ 下至少有一个 *.words.json 与 *.segments.json
 # 并检查关键字段存在即可；不检查语义与非空词数（因为合成哔声可能识别为空）。
 import json
+import os
 import sys
 from pathlib import Path
 
+try:
+    import ijson  # 可选依赖：流式解析，读到所需顶层键即停止
+except ImportError:
+    ijson = None
+
+WORDS_KEYS = ("schema", "audio", "backend", "words", "generated_at")
+SEGMENTS_KEYS = ("language", "duration_sec", "backend", "segments")
+
+def iter_top_level_keys(p: Path):
+    # 仅产出顶层对象的键名；大文件不会被整体载入内存
+    with p.open("rb") as fh:
+        for prefix, event, value in ijson.parse(fh):
+            if event == "map_key" and prefix == "":
+                yield value
+
 def check_json_has_keys(p: Path, must_keys):
-    obj = json.loads(p.read_text(encoding="utf-8"))
+    if ijson is None:
+        seen = json.loads(p.read_text(encoding="utf-8")).keys()
+    else:
+        pending = set(must_keys)
+        for key in iter_top_level_keys(p):
+            pending.discard(key)
+            if not pending:
+                break
+        seen = set(must_keys) - pending
     for k in must_keys:
-        if k not in obj:
+        if k not in seen:
             raise SystemExit(f"[validate] {p} missing key: {k}")
 
+def validate_stream(paths, must_keys):
+    # 逐个校验文件，共享同一份必需键元组；内存占用与文件数量无关
+    keys = tuple(must_keys)
+    for path in paths:
+        check_json_has_keys(Path(path), keys)
+        yield path
+
+def scan_outputs(out: Path):
+    # 单次遍历目录树，按后缀同时收集两类输出文件
+    words, segs = [], []
+    for root, _, files in os.walk(out):
+        for name in files:
+            if name.endswith(".words.json"):
+                words.append(os.path.join(root, name))
+            elif name.endswith(".segments.json"):
+                segs.append(os.path.join(root, name))
+    return words, segs
+
 def main(out_dir: str):
     out = Path(out_dir)
     if not out.exists():
         raise SystemExit(f"[validate] out dir not found: {out}")
-    words = sorted(out.rglob("*.words.json"))
-    segs = sorted(out.rglob("*.segments.json"))
+    words, segs = scan_outputs(out)
     if not words:
         raise SystemExit("[validate] no *.words.json produced")
     if not segs:
         raise SystemExit("[validate] no *.segments.json produced")
 
-    # 取第一个文件做最小字段校验
-    check_json_has_keys(words[0], ["schema", "audio", "backend", "words", "generated_at"])
-    check_json_has_keys(segs[0], ["language", "duration_sec", "backend", "segments"])
-    print(f"[validate] OK: {len(words)} words.json, {len(segs)} segments.json")
+    # 对全部输出文件做最小字段校验
+    n_words = sum(1 for _ in validate_stream(words, WORDS_KEYS))
+    n_segs = sum(1 for _ in validate_stream(segs, SEGMENTS_KEYS))
+    print(f"[validate] OK: {n_words} words.json, {n_segs} segments.json")
 
 if __name__ == "__main__":
     d = sys.argv[1] if len(sys.argv) > 1 else "out"
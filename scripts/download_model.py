@@ -3,18 +3,28 @@
 from __future__ import annotations  # 启用前向注解以便类型提示互引用。
 
 import argparse  # 导入 argparse 以解析命令行参数。
+import hashlib  # 导入 hashlib 以流式计算 sha256 校验值。
+import importlib.util  # 导入 importlib.util 以探测可选加速组件。
 import os  # 导入 os 以读取环境变量并处理路径。
 import sys  # 导入 sys 以支持自定义退出状态与错误输出。
+import time  # 导入 time 以在重试之间退避等待。
 from pathlib import Path  # 导入 Path 方便地处理路径拼接与创建目录。
 from typing import Optional  # 导入 Optional 用于类型注解。
 
-from huggingface_hub import HfApi, snapshot_download  # 导入 snapshot_download 完成断点下载，HfApi 检查凭证。
-from huggingface_hub.errors import HfHubHTTPError  # 导入 HfHubHTTPError 用于捕获 HTTP 层错误。
+if importlib.util.find_spec("hf_transfer") is not None:  # 安装了 hf_transfer 时启用多连接分段下载。
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")  # 需在导入 huggingface_hub 前设置；用户显式设置优先。
+
+# huggingface_hub 导入开销较大，仅在真正需要访问 Hub 的函数内延迟导入，
+# 使 --help、参数错误与“模型已就绪”路径无需加载它。
 
 
 DEFAULT_BACKEND = "faster-whisper"  # 默认后端名称，满足需求固定值。
 DEFAULT_MODEL = "large-v2"  # 默认模型名称，为中文场景推荐规格。
 DEFAULT_MODELS_DIR = os.path.expanduser("~/.cache/asrprogram/models")  # 默认模型缓存目录。
+DEFAULT_MAX_WORKERS = 8  # 默认并发下载线程数，小文件可与 model.bin 重叠传输。
+DEFAULT_RETRIES = 3  # 网络中断后的默认续传重试次数。
+RETRY_BACKOFF_SECONDS = 2.0  # 首次重试前的等待时长，之后按指数翻倍。
+FASTER_WHISPER_REQUIRED_FILES = ("config.json", "model.bin", "tokenizer.json")  # 判定就绪所需文件（词表文件名因仓库而异，不纳入）。
 
 
 def parse_args() -> argparse.Namespace:
@@ -33,6 +43,29 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="可选 Hugging Face token，若未提供则回退到环境变量或本地登录缓存",
     )  # 添加 token 参数。
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        help="并发下载的文件数，默认 8",
+    )  # 添加并发度参数。
+    parser.add_argument(
+        "--retries",
+        type=int,
+        default=DEFAULT_RETRIES,
+        help="网络中断后的续传重试次数，默认 3",
+    )  # 添加重试参数。
+    parser.add_argument("--force", action="store_true", help="即使模型已就绪也重新下载")  # 添加强制下载开关。
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="模型已就绪时对照 Hub 记录的 sha256 校验文件内容，不一致则重新下载",
+    )  # 添加内容校验开关。
+    parser.add_argument(
+        "--no-progress",
+        action="store_true",
+        help="关闭逐文件进度条（CI 日志或远程终端下可减少输出与刷新开销）",
+    )  # 添加关闭进度条开关。
     return parser.parse_args()  # 返回解析结果供主函数使用。
 
 
@@ -54,6 +87,8 @@ def pick_token(cli_token: Optional[str]) -> Optional[str]:
     if env_token:  # 若环境变量存在。
         return env_token  # 返回环境变量值。
     try:
+        from huggingface_hub import HfApi  # 延迟导入，仅在需要读取登录缓存时加载。
+
         stored_token = HfApi().get_token()  # 调用 HfApi 读取本地登录缓存。
         return stored_token  # 返回缓存 token，若不存在则为 None。
     except Exception:  # noqa: BLE001
@@ -69,6 +104,70 @@ def format_token_hint(token: Optional[str]) -> str:
     return f"🔑 使用 Hugging Face Token: {masked}"  # 返回格式化提示。
 
 
+def model_ready_faster_whisper(target_dir: Path) -> Optional[dict[str, int]]:
+    """若必需文件均存在且非空则返回 {文件名: 字节数}，否则返回 None。"""  # 函数说明。
+
+    try:
+        with os.scandir(target_dir) as entries:  # 一次目录读取取得全部条目，避免逐个拼路径 stat。
+            sizes = {entry.name: entry.stat().st_size for entry in entries if entry.name in FASTER_WHISPER_REQUIRED_FILES}  # 仅对必需文件取大小。
+    except (FileNotFoundError, NotADirectoryError):  # 目录不存在即未就绪。
+        return None  # 提前返回。
+    for name in FASTER_WHISPER_REQUIRED_FILES:  # 遍历必需文件。
+        if sizes.get(name, 0) <= 0:  # 缺失或空文件视为下载未完成。
+            return None  # 提前返回。
+    return sizes  # 全部满足时返回大小映射。
+
+
+def sha256_file(path: Path) -> str:
+    """流式计算文件的 sha256 十六进制摘要。"""  # 函数说明。
+
+    with path.open("rb") as handle:  # 以二进制模式打开文件。
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+ 在 C 层循环读取，避免逐块回到解释器。
+            return hashlib.file_digest(handle, "sha256").hexdigest()  # 返回摘要。
+        digest = hashlib.sha256()  # 旧版本退回分块 update。
+        for chunk in iter(lambda: handle.read(1 << 20), b""):  # 每次读取 1MB。
+            digest.update(chunk)  # 累积摘要。
+        return digest.hexdigest()  # 返回摘要。
+
+
+def verify_model_files(repo_id: str, target_dir: Path, token: Optional[str]) -> list[str]:
+    """对照 Hub 记录的 LFS sha256 校验本地文件，返回不一致的文件名列表。"""  # 函数说明。
+
+    from huggingface_hub import HfApi  # 延迟导入 Hub 客户端。
+
+    info = HfApi().model_info(repo_id, files_metadata=True, token=token)  # 仅拉取元数据，不下载内容。
+    mismatched: list[str] = []  # 初始化结果列表。
+    for sibling in info.siblings or []:  # 遍历仓库文件。
+        lfs = getattr(sibling, "lfs", None)  # 仅 LFS 文件携带 sha256。
+        expected = lfs.get("sha256") if isinstance(lfs, dict) else getattr(lfs, "sha256", None)  # 兼容新旧版本的结构。
+        if not expected:  # 普通小文件无 sha256，跳过。
+            continue
+        local_path = target_dir / sibling.rfilename  # 拼接本地路径。
+        if not local_path.is_file() or sha256_file(local_path) != expected:  # 缺失或内容不一致。
+            mismatched.append(sibling.rfilename)  # 记录问题文件。
+    return mismatched  # 返回校验结果。
+
+
+def configure_http_pool(pool_size: int) -> None:
+    """按并发度配置 huggingface_hub 共享的 HTTP 连接池，复用 Keep-Alive 连接。"""  # 函数说明。
+
+    try:
+        import requests  # 延迟导入 requests，仅在需要定制连接池时使用。
+        from huggingface_hub import configure_http_backend  # 旧版 hub 通过该钩子注入 Session。
+        from requests.adapters import HTTPAdapter  # 导入适配器以设置连接池大小。
+    except ImportError:  # 新版 hub 基于 httpx 并自带连接池，无需处理。
+        return  # 保持默认行为。
+
+    def backend_factory() -> requests.Session:
+        session = requests.Session()  # 每个线程共享同一配置的 Session。
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)  # 连接池与并发度一致，避免丢弃连接。
+        session.mount("https://", adapter)  # 为 HTTPS 挂载适配器。
+        session.mount("http://", adapter)  # 为 HTTP 镜像挂载适配器。
+        return session  # 返回配置好的 Session。
+
+    configure_http_backend(backend_factory=backend_factory)  # 注册工厂，后续请求复用 TCP/TLS 连接。
+
+
 def ensure_directory(path: Path) -> None:
     """确保目标目录存在。"""  # 函数说明。
 
@@ -79,6 +178,8 @@ def main() -> int:
     """脚本主入口：解析参数、下载模型并处理异常。"""  # 函数说明。
 
     args = parse_args()  # 解析命令行输入。
+    if args.no_progress:  # 需在首次导入 huggingface_hub 前设置，使其常量生效。
+        os.environ["HF_HUB_DISABLE_PROGRESS_BARS"] = "1"  # 关闭 tqdm 进度条。
     try:
         repo_id = resolve_repo_id(args.backend, args.model)  # 根据参数推导 Hugging Face 仓库。
     except ValueError as exc:  # 捕获不支持的后端错误。
@@ -86,34 +187,68 @@ def main() -> int:
         return 2  # 返回特定退出码。
     models_root = Path(args.models_dir).expanduser().resolve()  # 解析模型缓存根目录。
     target_dir = models_root / args.backend / args.model  # 拼接具体模型目录。
-    ensure_directory(target_dir)  # 确保缓存目录存在。
+    force = args.force  # 是否强制重新下载。
+    ready = not force and model_ready_faster_whisper(target_dir) is not None  # 检查本地是否已就绪。
+    if ready and not args.verify:  # 已就绪且未要求校验时无需访问网络。
+        print(f"[OK] 模型已就绪: {target_dir}（如需重新下载请添加 --force）")  # 输出跳过提示。
+        return 0  # 正常退出。
     token = pick_token(args.hf_token)  # 根据优先级选择 token。
+    if ready:  # 已就绪但要求校验内容。
+        try:
+            mismatched = verify_model_files(repo_id, target_dir, token)  # 对照 Hub 校验内容。
+        except Exception as exc:  # noqa: BLE001
+            print(f"[ERROR] 无法获取校验信息: {exc}")  # 输出错误。
+            return 1  # 返回失败码。
+        if not mismatched:  # 全部一致。
+            print(f"[OK] 模型已就绪且 sha256 校验通过: {target_dir}")  # 输出校验结果。
+            return 0  # 正常退出。
+        print(f"[WARN] sha256 校验失败: {', '.join(mismatched)}，将重新下载。")  # 输出不一致文件。
+        force = True  # 内容损坏时强制重新下载。
+    ensure_directory(target_dir)  # 确保缓存目录存在。
     print(format_token_hint(token))  # 输出 token 状态提示。
-    try:
-        local_dir = snapshot_download(
-            repo_id=repo_id,  # 指定模型仓库。
-            local_dir=str(target_dir),  # 指定本地缓存目录。
-            local_dir_use_symlinks=False,  # 禁用符号链接以兼容 Windows。
-            token=token,  # 传入 token（可为 None）。
-            resume_download=True,  # 启用断点续传。
-        )  # 执行下载。
-        print(f"[OK] 模型已就绪: {local_dir}")  # 下载成功后输出缓存路径。
-        return 0  # 正常退出。
-    except HfHubHTTPError as exc:  # 捕获 HTTP 层异常。
-        status = getattr(exc.response, "status_code", None)  # 尝试读取状态码。
-        print(f"[ERROR] 下载失败: {exc}")  # 输出基础错误信息。
-        if status in {401, 403}:  # 对 401/403 提供额外说明。
-            print("[HINT] 需要在 https://huggingface.co/settings/tokens 创建 Read token 并配置环境变量。")  # 提示创建 token。
-            print("[HINT] Linux/macOS: export HUGGINGFACE_HUB_TOKEN='hf_xxx'")  # 提示类 Unix 系统配置方式。
-            print("[HINT] Windows:    setx HUGGINGFACE_HUB_TOKEN hf_xxx")  # 提示 Windows 配置方式。
-            print("[HINT] 或执行 huggingface-cli login --token hf_xxx 完成持久化登录。")  # 提示登录命令。
-        else:  # 其他状态码通常为网络波动。
-            print("[HINT] 请检查网络连接，或稍后重试并确保已登录 Hugging Face。")  # 给出重试建议。
-        return 1  # 异常退出。
-    except Exception as exc:  # noqa: BLE001
-        print(f"[ERROR] 未知异常: {exc}")  # 捕获其他异常并输出。
-        print("[HINT] 可尝试重新运行命令，或在网络稳定后再试。")  # 提示重试建议。
-        return 1  # 返回通用失败码。
+    max_workers = max(1, args.max_workers)  # 规范化并发度。
+    configure_http_pool(max_workers)  # 按并发度调整连接池。
+    from huggingface_hub import snapshot_download  # 延迟导入下载函数。
+    from huggingface_hub.errors import HfHubHTTPError  # 延迟导入 HTTP 异常类型。
+
+    attempts = max(0, args.retries) + 1  # 总尝试次数 = 首次下载 + 重试次数。
+    for attempt in range(1, attempts + 1):  # 失败后重新进入下载，已完成的字节不会重复传输。
+        try:
+            local_dir = snapshot_download(
+                repo_id=repo_id,  # 指定模型仓库。
+                local_dir=str(target_dir),  # 指定本地缓存目录。
+                local_dir_use_symlinks=False,  # 禁用符号链接以兼容 Windows。
+                token=token,  # 传入 token（可为 None）。
+                resume_download=True,  # 启用断点续传：从 .incomplete 文件的当前偏移发起 Range 请求。
+                force_download=force,  # --force 或校验失败时忽略本地已有文件重新下载。
+                max_workers=max_workers,  # 多个文件并发下载，隐藏往返延迟。
+            )  # 执行下载。
+            print(f"[OK] 模型已就绪: {local_dir}")  # 下载成功后输出缓存路径。
+            return 0  # 正常退出。
+        except HfHubHTTPError as exc:  # 捕获 HTTP 层异常。
+            status = getattr(exc.response, "status_code", None)  # 尝试读取状态码。
+            if status in {401, 403}:  # 鉴权失败重试无意义，直接给出说明。
+                print(f"[ERROR] 下载失败: {exc}")  # 输出基础错误信息。
+                print("[HINT] 需要在 https://huggingface.co/settings/tokens 创建 Read token 并配置环境变量。")  # 提示创建 token。
+                print("[HINT] Linux/macOS: export HUGGINGFACE_HUB_TOKEN='hf_xxx'")  # 提示类 Unix 系统配置方式。
+                print("[HINT] Windows:    setx HUGGINGFACE_HUB_TOKEN hf_xxx")  # 提示 Windows 配置方式。
+                print("[HINT] 或执行 huggingface-cli login --token hf_xxx 完成持久化登录。")  # 提示登录命令。
+                return 1  # 异常退出。
+            error: Exception = exc  # 其他状态码通常为网络波动，记录后重试。
+            label = "下载失败"  # 最终错误前缀。
+            hint = "[HINT] 请检查网络连接，或稍后重试并确保已登录 Hugging Face。"  # 最终重试建议。
+        except Exception as exc:  # noqa: BLE001
+            error = exc  # 记录未知异常（连接中断、超时等）。
+            label = "未知异常"  # 最终错误前缀。
+            hint = "[HINT] 可尝试重新运行命令，或在网络稳定后再试。"  # 最终重试建议。
+        if attempt < attempts:  # 仍有重试机会时继续。
+            delay = RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1)  # 指数退避，避免在网络抖动期间连续失败。
+            print(f"[WARN] 第 {attempt}/{attempts} 次下载中断: {error}，{delay:.0f} 秒后从已下载部分续传。")  # 输出续传提示。
+            time.sleep(delay)  # 等待后再发起续传。
+    print(f"[ERROR] {label}: {error}")  # 重试耗尽后输出错误信息。
+    print(hint)  # 输出对应的建议。
+    print("[HINT] 已下载的部分会被保留，重新运行命令时将自动续传。")  # 提醒续传行为。
+    return 1  # 返回失败码。
 
 
 if __name__ == "__main__":  # 检查脚本是否被直接执行。
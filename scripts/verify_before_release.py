@@ -2,6 +2,7 @@
 # 注释：使用当前环境中的 Python 解释器运行脚本
 """发布前检查脚本，确保仓库符合发行要求。"""  # 注释：模块文档字符串描述用途
 
+import os  # 注释：使用 os.scandir 高效遍历目录
 import platform  # 注释：获取操作系统与 Python 版本信息
 import subprocess  # 注释：调用外部命令读取 Git 信息
 from pathlib import Path  # 注释：更方便地处理路径
@@ -14,6 +15,8 @@ REQUIRED_DIRS = [PROJECT_ROOT / name for name in ("src", "schemas", "config")]
 FORBIDDEN_SUFFIXES = {".wav", ".bin", ".model", ".gguf"}
 # 注释：设定文件大小阈值（50MB）
 SIZE_THRESHOLD = 50 * 1024 * 1024
+# 注释：扫描时整体跳过的目录（版本库元数据、虚拟环境与缓存，不属于发布内容）
+SKIP_DIRS = frozenset({".git", ".venv", "venv", "node_modules", "__pycache__", ".cache", "out"})
 
 
 def read_version() -> str:
@@ -29,39 +32,74 @@ def ensure_required_dirs() -> list[str]:
     return missing  # 注释：返回缺失列表
 
 
+def iter_release_files(root: Path):
+    """基于 os.walk 自顶向下遍历并原地剪除 SKIP_DIRS，产出文件的完整路径。"""  # 注释：函数用途
+    for current, dirs, files in os.walk(root, topdown=True):  # 注释：topdown 允许在下探前修改 dirs
+        dirs[:] = [name for name in dirs if name not in SKIP_DIRS]  # 注释：原地剪枝，被跳过的子树不会被读取
+        for name in files:
+            yield os.path.join(current, name)
+
+
+def list_tracked_files() -> list[str] | None:
+    """通过 git ls-files 读取受版本控制的文件；非 Git 仓库或命令失败时返回 None。"""  # 注释：函数用途
+    try:
+        result = subprocess.run(
+            ["git", "--no-optional-locks", "ls-files", "-z"],  # 注释：以 NUL 分隔输出，兼容含空格的文件名
+            cwd=PROJECT_ROOT,  # 注释：在仓库根目录运行
+            check=True,  # 注释：命令失败时抛出异常
+            stdout=subprocess.PIPE,  # 注释：捕获标准输出
+            stderr=subprocess.DEVNULL,
+        )
+    except (OSError, subprocess.CalledProcessError):  # 注释：未安装 git 或不在仓库内
+        return None
+    return [name for name in result.stdout.decode("utf-8", "surrogateescape").split("\0") if name]  # 注释：去除末尾空项
+
+
 def scan_forbidden_files() -> list[str]:
     """扫描禁用文件类型与超大文件，返回警告列表。"""  # 注释：函数用途
     warnings: list[str] = []  # 注释：初始化警告列表
-    for path in PROJECT_ROOT.rglob("*"):  # 注释：遍历仓库内全部文件
-        if not path.is_file():  # 注释：跳过目录
+    tracked = list_tracked_files()  # 注释：优先只检查会随发布提交的文件
+    if tracked is None:  # 注释：非 Git 环境回退到目录遍历
+        candidates = (os.path.relpath(path, PROJECT_ROOT) for path in iter_release_files(PROJECT_ROOT))
+    else:
+        candidates = tracked
+    for relative in candidates:  # 注释：逐个检查候选文件
+        if os.path.splitext(relative)[1].lower() in FORBIDDEN_SUFFIXES:  # 注释：先做后缀检查，命中则无需 stat
+            warnings.append(f"禁用文件类型：{relative}")  # 注释：记录警告
             continue
-        if path.suffix.lower() in FORBIDDEN_SUFFIXES:  # 注释：检测禁止后缀
-            warnings.append(f"禁用文件类型：{path.relative_to(PROJECT_ROOT)}")  # 注释：记录警告
+        try:
+            size = os.stat(PROJECT_ROOT / relative).st_size  # 注释：读取文件大小
+        except FileNotFoundError:  # 注释：已跟踪但在工作区中被删除
             continue
-        if path.stat().st_size > SIZE_THRESHOLD:  # 注释：检查文件是否超过大小阈值
-            warnings.append(f"文件过大（>{SIZE_THRESHOLD} bytes）：{path.relative_to(PROJECT_ROOT)}")  # 注释：记录警告
+        if size > SIZE_THRESHOLD:  # 注释：检查文件是否超过大小阈值
+            warnings.append(f"文件过大（>{SIZE_THRESHOLD} bytes）：{relative}")  # 注释：记录警告
     return warnings  # 注释：返回扫描结果
 
 
 def gather_dependency_summary() -> list[str]:
     """读取 requirements.txt 提供依赖摘要。"""  # 注释：函数用途
-    requirements = (PROJECT_ROOT / "requirements.txt").read_text(encoding="utf-8").splitlines()  # 注释：读取依赖文件
-    summary = [line.strip() for line in requirements if line.strip() and not line.startswith("#")]  # 注释：移除空行与注释
-    return summary  # 注释：返回整理后的依赖列表
+    content = (PROJECT_ROOT / "requirements.txt").read_text(encoding="utf-8")  # 注释：读取依赖文件
+    stripped = (line.strip() for line in content.splitlines())  # 注释：惰性去除首尾空白，每行只处理一次
+    return [line for line in stripped if line and not line.startswith("#")]  # 注释：单次遍历移除空行与注释
+
+
+def _git(*args: str) -> str:
+    """在仓库根目录执行一次 git 命令并返回去除首尾空白的标准输出。"""  # 注释：函数用途
+    result = subprocess.run(
+        ["git", "--no-optional-locks", *args],  # 注释：只读查询无需刷新索引锁，避免与其他 git 进程争用
+        cwd=PROJECT_ROOT,  # 注释：在仓库根目录运行
+        check=True,  # 注释：命令失败时抛出异常
+        stdout=subprocess.PIPE,  # 注释：捕获标准输出
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    return result.stdout.strip()  # 注释：返回命令输出
 
 
 def current_git_commit() -> str:
     """获取当前 Git 提交 ID。"""  # 注释：函数用途
     try:
-        result = subprocess.run(
-            ["git", "rev-parse", "HEAD"],  # 注释：Git 命令
-            cwd=PROJECT_ROOT,  # 注释：在仓库根目录运行
-            check=True,  # 注释：命令失败时抛出异常
-            stdout=subprocess.PIPE,  # 注释：捕获标准输出
-            stderr=subprocess.PIPE,
-            text=True,
-        )
-        return result.stdout.strip()  # 注释：返回提交哈希
+        return _git("rev-parse", "--verify", "HEAD")  # 注释：返回提交哈希
     except Exception as exc:  # 注释：捕获异常
         return f"unknown ({exc})"  # 注释：无法获取时提供说明
 
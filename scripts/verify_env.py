@@ -2,42 +2,67 @@
 """逐行注释的环境体检脚本，Round 10 增强 whisper.cpp 检测。"""  # 描述脚本用途。
 import argparse  # 解析命令行参数。
 import platform  # 获取平台与 Python 版本信息。
-import inspect  # 检查 faster-whisper API 是否支持词级参数。
-import subprocess  # 调用外部命令读取工具版本。
+import os  # 检查目录与可执行文件权限。
+import stat  # 解析 stat 结果中的文件类型。
 import sys  # 控制脚本退出码并访问解释器信息。
+import tempfile  # 定位系统临时目录以存放工具版本缓存。
+import threading  # 串行化并发探测对缓存文件的读写。
+import time  # 判断缓存条目是否过期。
+from functools import lru_cache  # 缓存外部工具探测结果。
 from pathlib import Path  # 优雅地处理路径。
-from typing import Dict, Iterable, List, Optional, Tuple  # 提供类型注解。
+from types import MappingProxyType  # 为静态参考表提供只读视图。
+from typing import Callable, Dict, Iterable, List, Optional, Tuple  # 提供类型注解。
 
-import yaml  # 读取默认配置文件。
-from src.utils.config import load_and_merge_config  # 导入配置加载器以输出 profile 与路径概览。
+# yaml、inspect、subprocess 与配置加载器在使用它们的函数内延迟导入，
+# 仅导入本模块（例如被测试或其他脚本复用辅助函数）时无需加载这些模块。
 
-REQUIRED_PACKAGES = [  # 定义必须存在的 Python 包。
+PROJECT_ROOT = Path(__file__).resolve().parent.parent  # 仓库根目录，导入时解析一次。
+DEFAULT_CONFIG_PATH = PROJECT_ROOT / "config" / "default.yaml"  # 默认配置文件路径。
+
+REQUIRED_PACKAGES = (  # 定义必须存在的 Python 包（只读元组）。
     ("faster_whisper", "faster-whisper"),  # faster-whisper 是核心依赖。
     ("numpy", "numpy"),  # 数值运算库。
     ("soundfile", "soundfile"),  # 音频读写库。
     ("tqdm", "tqdm"),  # 进度条库。
     ("yaml", "PyYAML"),  # 配置解析库。
     ("requests", "requests"),  # HTTP 请求库。
-]  # 必需包列表结束。
-OPTIONAL_PACKAGES = [  # 可选包列表。
+)  # 必需包列表结束。
+OPTIONAL_PACKAGES = (  # 可选包列表（只读元组）。
     ("torch", "torch"),  # faster-whisper 可结合 torch 使用 GPU。
-]  # 可选包列表结束。
-FASTER_WHISPER_FILES = ["config.json", "model.bin", "tokenizer.json", "vocabulary.json"]  # faster-whisper 所需文件名。
-FASTER_WHISPER_SIZE_HINT = {  # 不同规格模型的预估总大小（字节）。
+)  # 可选包列表结束。
+FASTER_WHISPER_FILES = ("config.json", "model.bin", "tokenizer.json", "vocabulary.json")  # faster-whisper 所需文件名（不可变元组）。
+_FASTER_WHISPER_FILESET = frozenset(FASTER_WHISPER_FILES)  # 供目录扫描时 O(1) 过滤无关条目。
+FASTER_WHISPER_SIZE_HINT = MappingProxyType({  # 不同规格模型的预估总大小（字节），只读防止被意外修改。
     "tiny": 70 * 1024 * 1024,  # 约 70MB。
     "base": 130 * 1024 * 1024,  # 约 130MB。
     "small": 430 * 1024 * 1024,  # 约 430MB。
     "medium": 1_400 * 1024 * 1024,  # 约 1.4GB。
     "large-v2": 2_950 * 1024 * 1024,  # 约 2.9GB。
     "large-v3": 3_000 * 1024 * 1024,  # 约 3GB。
-}  # 大小参考结束。
-WHISPER_CPP_SIZE_HINT = {  # whisper.cpp 常见模型的体积预估。
+})  # 大小参考结束。
+WHISPER_CPP_SIZE_HINT = MappingProxyType({  # whisper.cpp 常见模型的体积预估，只读。
     "tiny": 75 * 1024 * 1024,  # ggml-tiny 约 75MB。
     "base": 145 * 1024 * 1024,  # ggml-base 约 145MB。
     "small": 480 * 1024 * 1024,  # ggml-small 约 480MB。
     "medium": 1_500 * 1024 * 1024,  # ggml-medium 约 1.5GB。
     "large-v3": 3_050 * 1024 * 1024,  # ggml-large-v3 约 3.05GB。
-}  # whisper.cpp 体积参考结束。
+})  # whisper.cpp 体积参考结束。
+WHISPER_CPP_FILENAMES = MappingProxyType({  # whisper.cpp 各规格的默认模型文件名，只读。
+    "tiny": "ggml-tiny.bin",
+    "base": "ggml-base.bin",
+    "small": "ggml-small.bin",
+    "medium": "ggml-medium.bin",
+    "large-v3": "ggml-large-v3.bin",
+})  # whisper.cpp 文件名表结束。
+TOOL_CACHE_PATH = Path(tempfile.gettempdir()) / "asrprogram_tool_ver.json"  # 外部工具版本的磁盘缓存文件。
+TOOL_CACHE_TTL = 24 * 3600  # 缓存有效期（秒）；可执行文件路径或 mtime 变化时立即失效。
+_TOOL_CACHE_LOCK = threading.Lock()  # 并发探测共用同一缓存文件，读改写需加锁。
+
+
+@lru_cache(maxsize=64)
+def expand_user_path(path_str: str) -> Path:
+    """展开用户提供路径中的 ~，同一字符串只解析一次（多个检查会重复传入同一路径）。"""  # 函数说明。
+    return Path(path_str).expanduser()  # 返回展开后的路径。
 
 
 def print_section(title: str) -> None:
@@ -53,9 +78,9 @@ def print_kv(label: str, value: str) -> None:
 
 def load_defaults() -> Dict[str, object]:
     """从 config/default.yaml 读取默认配置。"""  # 函数说明。
-    config_path = Path(__file__).resolve().parent.parent / "config" / "default.yaml"  # 计算配置文件路径。
-    with config_path.open("r", encoding="utf-8") as handle:  # 打开配置文件。
-        return yaml.safe_load(handle)  # 解析 YAML 并返回字典。
+    from src.utils.config import _load_yaml  # 复用配置模块按 (路径, mtime, 大小) 缓存的解析结果。
+
+    return _load_yaml(DEFAULT_CONFIG_PATH)  # 返回独立副本；随后 load_and_merge_config 读取同一文件时直接命中缓存。
 
 
 def build_parser(defaults: Dict[str, object]) -> argparse.ArgumentParser:
@@ -74,6 +99,7 @@ def build_parser(defaults: Dict[str, object]) -> argparse.ArgumentParser:
     parser.add_argument("--whispercpp-exe", default=whisper_defaults.get("executable_path", ""), help="whisper.cpp 可执行文件路径。")  # 可执行参数。
     parser.add_argument("--whispercpp-model", default=whisper_defaults.get("model_path", ""), help="whisper.cpp GGML/GGUF 模型路径。")  # 模型路径参数。
     parser.add_argument("--profile", default=profile_default, help="可选 profile 名称，用于演示配置覆盖效果。")  # 新增 profile 参数。
+    parser.add_argument("--deep", action="store_true", help="额外执行模型加载测试（会将完整模型载入内存/显存，耗时较长）。")  # 深度检查开关。
     return parser  # 返回解析器。
 
 
@@ -88,50 +114,100 @@ def evaluate_python_version() -> Tuple[str, str]:
     return status, advice  # 返回结果。
 
 
-def read_package_version(module_name: str) -> Optional[str]:
-    """尝试导入模块并返回版本号，失败时返回 None。"""  # 函数说明。
+def read_package_version(module_name: str, distribution_name: Optional[str] = None) -> Optional[str]:
+    """返回包版本号，未安装时返回 None；优先读取安装元数据，避免真正执行模块导入。"""  # 函数说明。
+    from importlib import metadata  # 延迟导入 importlib.metadata。
+
+    try:  # 读取 dist-info 中的版本，torch 等重量级包无需导入即可得到版本。
+        return metadata.version(distribution_name or module_name)  # 返回发行版版本号。
+    except metadata.PackageNotFoundError:  # 无元数据时回退到导入模块。
+        pass
     try:  # 捕获导入异常。
         module = __import__(module_name)  # 动态导入模块。
     except Exception:  # 导入失败时。
         return None  # 返回 None。
     version = getattr(module, "__version__", None)  # 读取 __version__ 属性。
-    if version is None and module_name == "yaml":  # 针对 PyYAML 的兼容逻辑。
-        version = getattr(module, "__version__", None)  # 再次尝试读取版本。
     return str(version) if version is not None else "已安装，版本未知"  # 格式化返回值。
 
 
 def evaluate_packages(packages: Iterable[Tuple[str, str]]) -> List[str]:
     """检查包是否已安装并返回状态字符串。"""  # 函数说明。
-    reports: List[str] = []  # 初始化结果列表。
-    for module_name, display_name in packages:  # 遍历包列表。
-        version = read_package_version(module_name)  # 获取版本。
-        if version is None:  # 未安装时。
-            reports.append(f"WARNING: {display_name} 未安装")  # 添加警告。
-        else:  # 已安装时。
-            reports.append(f"OK: {display_name} {version}")  # 添加成功信息。
-    return reports  # 返回列表。
+    return [  # 列表推导式一次构建结果，省去逐项 append。
+        f"WARNING: {display_name} 未安装"  # 未安装时给出警告。
+        if (version := read_package_version(module_name, display_name)) is None  # 获取版本（显示名即发行版名称）。
+        else f"OK: {display_name} {version}"  # 已安装时输出版本。
+        for module_name, display_name in packages  # 遍历包列表。
+    ]
+
+
+COMMAND_TIMEOUT = 10  # 外部命令探测的超时时间（秒），避免卡死的可执行文件阻塞体检。
 
 
 def run_command(command: List[str]) -> Tuple[int, str]:
     """执行外部命令并返回状态码与首行输出。"""  # 函数说明。
+    import subprocess  # 延迟导入 subprocess。
+
     try:  # 捕获命令执行异常。
         completed = subprocess.run(  # 调用 subprocess。
             command,  # 命令列表。
             check=False,  # 不在失败时抛异常。
+            stdin=subprocess.DEVNULL,  # 不继承终端输入，避免探测命令等待输入而拖到超时。
             stdout=subprocess.PIPE,  # 捕获标准输出。
-            stderr=subprocess.STDOUT,  # 合并标准错误。
-            text=True,  # 文本模式。
-        )  # run 调用结束。
+            stderr=subprocess.STDOUT,  # 合并标准错误（部分工具将帮助信息写入 stderr）。
+            timeout=COMMAND_TIMEOUT,  # 限制最长等待时间。
+        )  # run 调用结束；保持字节模式，只解码需要的首行。
     except FileNotFoundError:  # 未找到命令时。
         return 127, "命令不存在"  # 返回特殊状态。
-    output_line = completed.stdout.splitlines()[0] if completed.stdout else "无输出"  # 读取首行。
-    return completed.returncode, output_line  # 返回状态码与输出。
+    except OSError as exc:  # 权限不足或格式错误等无法执行的情况。
+        return 126, f"无法执行: {exc}"  # 与 shell 的“不可执行”退出码保持一致。
+    except subprocess.TimeoutExpired:  # 超时未退出时。
+        return 124, "命令超时"  # 与 coreutils timeout 的退出码保持一致。
+    if not completed.stdout:  # 无输出时。
+        return completed.returncode, "无输出"  # 返回占位文本。
+    first_line = completed.stdout.split(b"\n", 1)[0].rstrip(b"\r")  # 只切出首行，不拆分整个输出。
+    return completed.returncode, first_line.decode("utf-8", "replace")  # 返回状态码与输出。
 
 
+def _read_tool_cache() -> Dict[str, Dict[str, object]]:
+    """读取工具版本缓存，文件缺失或损坏时返回空字典。"""  # 函数说明。
+    import json  # 延迟导入 json。
+
+    try:  # 容忍缓存文件不存在或内容损坏。
+        data = json.loads(TOOL_CACHE_PATH.read_text(encoding="utf-8"))  # 解析缓存内容。
+    except (OSError, ValueError):  # 读取或解析失败时。
+        return {}  # 视为空缓存。
+    return data if isinstance(data, dict) else {}  # 仅接受字典结构。
+
+
+@lru_cache(maxsize=None)
 def check_tool_version(tool_name: str) -> str:
-    """获取工具版本信息。"""  # 函数说明。
-    status, line = run_command([tool_name, "-version"])  # 执行工具的 -version。
+    """获取工具版本信息（进程内按工具名缓存，跨进程按可执行文件路径与 mtime 缓存到磁盘）。"""  # 函数说明。
+    import shutil  # 延迟导入 shutil 以定位可执行文件。
+
+    executable = shutil.which(tool_name)  # 在 PATH 中查找工具。
+    if executable is None:  # 未找到命令时。
+        return f"WARNING: 未检测到 {tool_name}"  # 返回警告。
+    try:  # 读取可执行文件的修改时间作为缓存键的一部分。
+        key = f"{executable}:{os.stat(executable).st_mtime_ns}"  # 工具升级或替换后键随之变化。
+    except OSError:  # 无法读取元数据时不使用缓存。
+        key = None  # 标记跳过缓存。
+    if key is not None:  # 尝试命中磁盘缓存。
+        with _TOOL_CACHE_LOCK:  # 与并发写入互斥。
+            entry = _read_tool_cache().get(key)  # 查找缓存条目。
+        if isinstance(entry, dict) and time.time() - float(entry.get("time", 0)) < TOOL_CACHE_TTL:  # 条目未过期。
+            return str(entry.get("line", ""))  # 直接返回缓存结果，跳过子进程。
+    status, line = run_command([executable, "-version"])  # 执行工具的 -version。
     if status == 0:  # 成功时。
+        if key is not None:  # 仅缓存成功结果。
+            from src.utils.io import atomic_write_json  # 延迟导入原子写入工具。
+
+            with _TOOL_CACHE_LOCK:  # 读改写期间持锁，避免并发探测互相覆盖。
+                cache = _read_tool_cache()  # 重新读取最新缓存。
+                cache[key] = {"line": line, "time": time.time()}  # 写入新条目。
+                try:  # 缓存写入失败不影响体检结果。
+                    atomic_write_json(TOOL_CACHE_PATH, cache)  # 原子替换缓存文件。
+                except OSError:  # 临时目录不可写等情况。
+                    pass  # 忽略缓存错误。
         return line  # 返回输出。
     if status == 127:  # 未找到命令时。
         return f"WARNING: 未检测到 {tool_name}"  # 返回警告。
@@ -140,19 +216,20 @@ def check_tool_version(tool_name: str) -> str:
 
 def os_access_write(path: Path) -> bool:
     """判断当前用户对目录是否可写。"""  # 函数说明。
-    import os  # 延迟导入 os 模块。
     return os.access(path, os.W_OK)  # 返回可写性判断。
 
 
 def evaluate_directory(path: Path) -> Tuple[str, str]:
     """返回目录状态与建议。"""  # 函数说明。
-    if path.exists():  # 若路径存在。
-        if path.is_dir():  # 且为目录。
-            if os_access_write(path):  # 若可写。
-                return "存在且可写", "无需操作"  # 返回正常状态。
-            return "存在但不可写", "WARNING: 请调整权限"  # 返回警告。
+    try:  # 单次 stat 同时判断存在性与类型，替代 exists()/is_dir() 两次系统调用。
+        mode = path.stat().st_mode  # 读取文件模式。
+    except (FileNotFoundError, NotADirectoryError):  # 路径不存在时。
+        return "未找到", "执行安装脚本时将自动创建"  # 不存在时提示。
+    if not stat.S_ISDIR(mode):  # 存在但不是目录。
         return "路径存在但非目录", "WARNING: 请删除后重新创建"  # 类型异常。
-    return "未找到", "执行安装脚本时将自动创建"  # 不存在时提示。
+    if os_access_write(path):  # 若可写。
+        return "存在且可写", "无需操作"  # 返回正常状态。
+    return "存在但不可写", "WARNING: 请调整权限"  # 返回警告。
 
 
 def check_model_status(
@@ -168,7 +245,7 @@ def check_model_status(
     total_size = 0  # 初始化总体积。
     if backend_lower == "whisper.cpp":  # 当目标为 whisper.cpp 时。
         if whisper_model_override:  # 若提供了直接的模型文件路径。
-            override_path = Path(whisper_model_override).expanduser()  # 展开路径。
+            override_path = expand_user_path(whisper_model_override)  # 展开路径。
             if not override_path.exists():  # 文件不存在。
                 return "MISSING", override_path, 0, []  # 返回缺失状态。
             if not override_path.is_file():  # 不是文件。
@@ -178,13 +255,7 @@ def check_model_status(
             if hint and size < hint * 0.6:  # 当体积明显小于预期。
                 return "SMALL", override_path, size, []  # 返回过小状态。
             return "READY", override_path, size, []  # 返回就绪。
-        filename_hint = {
-            "tiny": "ggml-tiny.bin",
-            "base": "ggml-base.bin",
-            "small": "ggml-small.bin",
-            "medium": "ggml-medium.bin",
-            "large-v3": "ggml-large-v3.bin",
-        }.get(model, "")  # 根据模型名称推断文件名。
+        filename_hint = WHISPER_CPP_FILENAMES.get(model, "")  # 根据模型名称推断文件名。
         if filename_hint:
             file_path = target_dir / filename_hint  # 拼接默认路径。
             if not file_path.exists():  # 文件缺失。
@@ -197,12 +268,21 @@ def check_model_status(
         return "UNKNOWN BACKEND", target_dir, 0, []  # 未知模型名称。
     if backend_lower != "faster-whisper":  # 对其他后端暂未实现。
         return "UNKNOWN BACKEND", target_dir, total_size, missing  # 返回占位状态。
+    try:  # 一次读取目录条目，替代逐个文件的 exists()+stat() 两次系统调用。
+        with os.scandir(target_dir) as it:  # 遍历模型目录。
+            entries = {entry.name: entry for entry in it if entry.name in _FASTER_WHISPER_FILESET}  # 仅索引必需文件的目录条目。
+    except (FileNotFoundError, NotADirectoryError):  # 目录不存在时所有文件均缺失。
+        entries = {}  # 使用空映射。
     for filename in FASTER_WHISPER_FILES:  # 遍历必需文件。
-        file_path = target_dir / filename  # 构造文件路径。
-        if not file_path.exists():  # 若文件缺失。
+        entry = entries.get(filename)  # 查找对应条目。
+        try:  # 失效的符号链接与缺失文件同等处理。
+            size = entry.stat().st_size if entry is not None else None  # 读取大小。
+        except OSError:  # 无法 stat 时。
+            size = None  # 视为缺失。
+        if size is None:  # 若文件缺失。
             missing.append(filename)  # 记录缺失文件。
             continue  # 检查下一个文件。
-        total_size += file_path.stat().st_size  # 累加文件大小。
+        total_size += size  # 累加文件大小。
     expected_size = FASTER_WHISPER_SIZE_HINT.get(model, 0)  # 获取预估体积。
     if missing:  # 若存在缺失文件。
         return "MISSING", target_dir, total_size, missing  # 返回缺失状态。
@@ -211,21 +291,20 @@ def check_model_status(
     return "READY", target_dir, total_size, []  # 所有条件满足时返回就绪。
 
 
+BYTE_UNITS = ("B", "KB", "MB", "GB", "TB")  # 字节单位，下标 i 对应 1024**i。
+
+
 def format_bytes(size: int) -> str:
     """将字节数格式化为易读文本。"""  # 函数说明。
     if size <= 0:  # 非正值直接返回。
         return "0B"  # 返回 0B。
-    units = ["B", "KB", "MB", "GB", "TB"]  # 定义单位列表。
-    value = float(size)  # 将数值转为浮点数。
-    for unit in units:  # 遍历单位。
-        if value < 1024 or unit == units[-1]:  # 当值小于 1024 或到达最后单位。
-            return f"{value:.2f}{unit}"  # 返回格式化字符串。
-        value /= 1024  # 否则继续换算。
-    return f"{value:.2f}TB"  # 理论上不会达到此行。
+    index = min((size.bit_length() - 1) // 10, len(BYTE_UNITS) - 1)  # 由二进制位数直接求出 floor(log1024(size))，无需循环。
+    return f"{size / (1 << (10 * index)):.2f}{BYTE_UNITS[index]}"  # 一次除法完成换算。
 
 
+@lru_cache(maxsize=1)
 def import_faster_whisper() -> Tuple[Optional[object], Optional[str]]:
-    """尝试导入 faster_whisper 并返回模块与版本。"""  # 函数说明。
+    """尝试导入 faster_whisper 并返回模块与版本（结果缓存，重复调用不再重试导入）。"""  # 函数说明。
     try:  # 捕获导入异常。
         import faster_whisper  # type: ignore  # 导入模块。
     except Exception:  # 导入失败时。
@@ -234,6 +313,28 @@ def import_faster_whisper() -> Tuple[Optional[object], Optional[str]]:
     return faster_whisper, str(version)  # 返回模块对象与版本字符串。
 
 
+def check_model_files_readable(model_path: Path) -> Tuple[bool, str]:
+    """不加载权重，仅校验 JSON 元数据可解析且 model.bin 可读，用于默认的快速检查。"""  # 函数说明。
+    import json  # 延迟导入 json。
+
+    for name in ("config.json", "tokenizer.json"):  # 校验元数据文件。
+        try:  # 捕获读取或解析失败。
+            with (model_path / name).open("rb") as handle:  # 以二进制打开，由 json 自行识别编码。
+                data = json.load(handle)  # 解析 JSON。
+        except (OSError, ValueError) as exc:  # 文件损坏或不可读。
+            return False, f"WARNING: {name} 无法解析 -> {exc}"  # 返回失败原因。
+        if not isinstance(data, dict):  # 顶层应为对象。
+            return False, f"WARNING: {name} 结构异常（顶层不是对象）"  # 返回失败原因。
+    try:  # 读取权重文件开头，确认文件可访问。
+        with (model_path / "model.bin").open("rb") as handle:  # 打开权重文件。
+            header = handle.read(16)  # 仅读取少量字节，不触及完整权重。
+    except OSError as exc:  # 无法读取时。
+        return False, f"WARNING: model.bin 无法读取 -> {exc}"  # 返回失败原因。
+    if len(header) < 16:  # 文件过短，显然不是有效模型。
+        return False, "WARNING: model.bin 内容过短，可能下载不完整"  # 返回失败原因。
+    return True, "OK: 模型文件结构检查通过（未加载权重）"  # 返回成功信息。
+
+
 def try_lightweight_model_load(module: object, model_path: Path) -> Tuple[bool, str]:
     """若模型存在则尝试快速构造 WhisperModel，用于验证可加载性。"""  # 函数说明。
     try:  # 捕获潜在加载异常。
@@ -248,15 +349,30 @@ def try_lightweight_model_load(module: object, model_path: Path) -> Tuple[bool,
     return True, "OK: 模型加载测试通过"  # 返回成功信息。
 
 
+WORD_TIMESTAMPS_MIN_VERSION = (0, 9)  # 自该版本起 transcribe 接受 word_timestamps 参数。
+WORD_TIMESTAMPS_OK = "OK: faster-whisper 支持 word_timestamps，词级时间戳已启用。"  # 支持时的提示文本。
+
+
+def parse_version_prefix(version: str) -> Optional[Tuple[int, int]]:
+    """解析版本号的主次版本，无法解析时返回 None。"""  # 函数说明。
+    import re  # 延迟导入 re。
+
+    match = re.match(r"(\d+)\.(\d+)", version)  # 只取开头的 major.minor。
+    return (int(match.group(1)), int(match.group(2))) if match else None  # 返回整数元组。
+
+
+@lru_cache(maxsize=1)
 def check_word_timestamp_support(module: object) -> str:
-    """检测 faster-whisper 是否接受 word_timestamps 参数并返回说明文本。"""  # 函数说明。
+    """检测 faster-whisper 是否接受 word_timestamps 参数并返回说明文本（按模块对象缓存签名解析结果）。"""  # 函数说明。
+    import inspect  # 延迟导入 inspect，仅在检查签名时使用。
+
     try:  # 捕获属性缺失或签名解析异常。
         WhisperModel = getattr(module, "WhisperModel")  # 获取模型类。
         signature = inspect.signature(WhisperModel.transcribe)  # 读取 transcribe 的参数签名。
     except Exception:  # 任意异常均视为未知状态。
         return "WARNING: 无法判断 word_timestamps 支持，请手动查阅 faster-whisper 版本。"  # 返回警告。
     if "word_timestamps" in signature.parameters:  # 若签名包含目标参数。
-        return "OK: faster-whisper 支持 word_timestamps，词级时间戳已启用。"  # 返回肯定信息。
+        return WORD_TIMESTAMPS_OK  # 返回肯定信息。
     return "WARNING: 当前 faster-whisper 不接受 word_timestamps，请升级至 0.9+。"  # 返回缺失提示。
 
 
@@ -264,13 +380,13 @@ def evaluate_whispercpp_executable(path_str: str) -> Tuple[str, str, str, str]:
     """评估 whisper.cpp 可执行文件状态并返回状态、建议、版本与路径。"""  # 函数说明。
     if not path_str:  # 未提供路径时。
         return "MISSING", "WARNING: 未提供 whisper.cpp 可执行文件路径。", "unknown", ""  # 返回缺失状态。
-    exe_path = Path(path_str).expanduser()  # 展开用户目录。
-    if not exe_path.exists():  # 文件不存在时。
+    exe_path = expand_user_path(path_str)  # 展开用户目录。
+    try:  # 单次 stat 同时判断存在性与类型。
+        mode = exe_path.stat().st_mode  # 读取文件模式。
+    except (FileNotFoundError, NotADirectoryError):  # 文件不存在时。
         return "MISSING", f"WARNING: 未找到 whisper.cpp 可执行文件: {exe_path}", "unknown", str(exe_path)  # 返回缺失。
-    if not exe_path.is_file():  # 指定路径不是普通文件。
+    if not stat.S_ISREG(mode):  # 指定路径不是普通文件。
         return "INVALID", f"WARNING: 指定路径不是可执行文件: {exe_path}", "unknown", str(exe_path)  # 返回无效状态。
-    import os  # 延迟导入 os 检查执行权限。
-
     if not os.access(exe_path, os.X_OK):  # 缺少执行权限时。
         return "NO PERMISSION", f"WARNING: whisper.cpp 可执行文件缺少执行权限: {exe_path}", "unknown", str(exe_path)  # 返回权限警告。
     version_line = "unknown"  # 默认版本信息。
@@ -288,7 +404,7 @@ def evaluate_whispercpp_model(path_str: str, model_name: str) -> Tuple[str, str,
     """评估 whisper.cpp 模型文件状态并返回状态、建议、路径与大小。"""  # 函数说明。
     if not path_str:  # 未提供模型路径时。
         return "MISSING", "INFO: 未提供 whisper.cpp 模型路径，可在需要时补充。", "", 0  # 返回缺失状态。
-    model_path = Path(path_str).expanduser()  # 展开路径。
+    model_path = expand_user_path(path_str)  # 展开路径。
     if not model_path.exists():  # 文件不存在。
         return "MISSING", f"WARNING: 未找到 whisper.cpp 模型文件: {model_path}", str(model_path), 0  # 返回缺失状态。
     if not model_path.is_file():  # 指定路径不是文件。
@@ -301,13 +417,22 @@ def evaluate_whispercpp_model(path_str: str, model_name: str) -> Tuple[str, str,
     return "READY", "OK: whisper.cpp 模型文件可用。", str(model_path), size  # 返回成功状态。
 
 
-def main() -> None:
-    """脚本主入口，输出完整体检报告。"""  # 函数说明。
+def run_report(flush: Callable[[], None]) -> None:
+    """执行全部检查并打印体检报告；flush 用于在耗时操作前先输出已缓冲的内容。"""  # 函数说明。
+    from concurrent.futures import ThreadPoolExecutor  # 延迟导入线程池以并发执行外部命令探测。
+
+    from src.utils.config import load_and_merge_config  # 延迟导入配置加载器以输出 profile 与路径概览。
+
     defaults = load_defaults()  # 读取默认配置。
     parser = build_parser(defaults)  # 构建解析器。
     args = parser.parse_args()  # 解析命令行参数。
-    models_dir = Path(args.models_dir).expanduser().resolve()  # 解析模型目录。
-    cache_dir = Path(args.cache_dir).expanduser().resolve()  # 解析缓存目录。
+    probe_pool = ThreadPoolExecutor(max_workers=3)  # 子进程探测主要在等待 I/O，线程并发即可重叠耗时。
+    ffmpeg_future = probe_pool.submit(check_tool_version, "ffmpeg")  # 提前启动 ffmpeg 探测。
+    ffprobe_future = probe_pool.submit(check_tool_version, "ffprobe")  # 提前启动 ffprobe 探测。
+    exec_future = probe_pool.submit(evaluate_whispercpp_executable, args.whispercpp_exe)  # 提前启动 whisper.cpp 探测。
+    probe_pool.shutdown(wait=False)  # 不再提交新任务；已提交的探测在后台继续执行，结果按需取用。
+    models_dir = expand_user_path(args.models_dir).resolve()  # 解析模型目录。
+    cache_dir = expand_user_path(args.cache_dir).resolve()  # 解析缓存目录。
     cli_overrides: Dict[str, object] = {  # 构造传入配置加载器的覆盖层。
         "models_dir": str(models_dir),  # 将模型目录写入配置树。
         "cache_dir": str(cache_dir),  # 将缓存目录写入配置树。
@@ -358,24 +483,30 @@ def main() -> None:
     optional_reports = evaluate_packages(OPTIONAL_PACKAGES)  # 检查可选包。
     for report in optional_reports:  # 遍历结果。
         print(report)  # 输出每项。
-    module, fw_version = import_faster_whisper()  # 试图导入 faster-whisper。
+    fw_version = read_package_version("faster_whisper", "faster-whisper")  # 从安装元数据读取版本，不导入模块（避免加载 CTranslate2/CUDA）。
     print_section("faster-whisper 状态")  # 打印 faster-whisper 信息标题。
-    if module is None:  # 导入失败时。
+    if fw_version is None:  # 未安装时。
         print("WARNING: 无法导入 faster-whisper，请运行 scripts/setup.sh")  # 提示安装依赖。
-    else:  # 导入成功时。
-        print_kv("faster-whisper 版本", fw_version or "未知")  # 输出版本。
-        print(check_word_timestamp_support(module))  # 输出词级时间戳支持状态。
+    else:  # 已安装时。
+        print_kv("faster-whisper 版本", fw_version)  # 输出版本。
+        parsed_version = parse_version_prefix(fw_version)  # 解析主次版本。
+        if parsed_version is not None and parsed_version >= WORD_TIMESTAMPS_MIN_VERSION:  # 版本足够新时无需导入即可确认。
+            print(WORD_TIMESTAMPS_OK)  # 输出词级时间戳支持状态。
+        else:  # 版本过旧或无法解析时，导入模块检查真实签名。
+            module, _ = import_faster_whisper()  # 导入 faster-whisper。
+            if module is None:  # 导入失败时。
+                print("WARNING: 无法导入 faster-whisper，请运行 scripts/setup.sh")  # 提示安装依赖。
+            else:  # 导入成功时。
+                print(check_word_timestamp_support(module))  # 输出词级时间戳支持状态。
     print_section("多媒体工具版本")  # 打印工具检测标题。
-    print_kv("ffmpeg", check_tool_version("ffmpeg"))  # 输出 ffmpeg 版本。
-    print_kv("ffprobe", check_tool_version("ffprobe"))  # 输出 ffprobe 版本。
+    print_kv("ffmpeg", ffmpeg_future.result())  # 输出 ffmpeg 版本。
+    print_kv("ffprobe", ffprobe_future.result())  # 输出 ffprobe 版本。
     print_section("目录可写性")  # 打印目录可写性标题。
-    directories = [Path("out"), Path(".cache"), cache_dir, models_dir]  # 汇总需要关注的目录。
-    seen: set[Path] = set()  # 使用集合去重。
-    for directory in directories:  # 遍历目录。
-        normalized = directory  # 暂存标准化路径。
-        if normalized in seen:  # 若已处理则跳过。
-            continue  # 继续下一个。
-        seen.add(normalized)  # 记录已处理。
+    directories = tuple(dict.fromkeys(  # dict.fromkeys 按首次出现顺序去重。
+        path.expanduser().resolve()  # 统一解析为绝对路径，使 .cache 与默认 cache_dir 等别名能被去重。
+        for path in (Path("out"), Path(".cache"), cache_dir, models_dir)  # 汇总需要关注的目录。
+    ))
+    for normalized in directories:  # 遍历去重后的目录。
         status, advice = evaluate_directory(normalized)  # 获取状态。
         print_kv(f"{normalized} 状态", status)  # 输出状态。
         print_kv(f"{normalized} 建议", advice)  # 输出建议。
@@ -393,11 +524,19 @@ def main() -> None:
     if model_status == "READY":  # 模型就绪时。
         print_kv("MODEL STATUS", "READY")  # 输出就绪状态。
         print_kv("SIZE", format_bytes(model_size))  # 输出模型大小。
-        if module is not None:  # 若 faster-whisper 可导入。
-            ok, message = try_lightweight_model_load(module, model_path)  # 进行轻量加载测试。
-            print(message)  # 输出加载结果。
-        else:  # 模块缺失无法测试。
-            print("WARNING: faster-whisper 未安装，跳过模型加载测试。")  # 输出警告。
+        if not args.deep:  # 默认跳过最耗时的模型加载。
+            if model_path.is_dir():  # faster-whisper 模型目录做快速结构检查。
+                ok, message = check_model_files_readable(model_path)  # 校验元数据与权重文件头。
+                print(message)  # 输出检查结果。
+            print("INFO: 跳过模型加载测试（如需验证可加载性请添加 --deep）。")  # 输出提示。
+        else:  # 仅在深度检查时才真正导入 faster-whisper。
+            module, _ = import_faster_whisper()  # 导入模块（结果已缓存）。
+            if module is not None:  # 若 faster-whisper 可导入。
+                flush()  # 加载可能耗时较长，先输出已有报告。
+                ok, message = try_lightweight_model_load(module, model_path)  # 进行轻量加载测试。
+                print(message)  # 输出加载结果。
+            else:  # 模块缺失无法测试。
+                print("WARNING: faster-whisper 未安装，跳过模型加载测试。")  # 输出警告。
     elif model_status == "UNKNOWN BACKEND":  # 未知后端时。
         print_kv("MODEL STATUS", "UNKNOWN")  # 输出未知状态。
         print("WARNING: verify_env.py 暂未内置该后端的完整校验逻辑。")  # 打印警告。
@@ -410,7 +549,7 @@ def main() -> None:
             print("WARNING: 模型体积低于预估值，可能下载不完整，建议重新执行下载脚本。")  # 输出提示。
         print("HINT: 可运行 scripts/download_model.py --force 重新下载，或手动放置文件后再次验证。")  # 提供提示。
     print_section("whisper.cpp 状态")  # 打印 whisper.cpp 体检标题。
-    exec_status, exec_advice, exec_version, exec_path = evaluate_whispercpp_executable(args.whispercpp_exe)  # 评估可执行文件。
+    exec_status, exec_advice, exec_version, exec_path = exec_future.result()  # 取回可执行文件评估结果。
     model_status_cpp, model_advice, model_path_cpp, model_size_cpp = evaluate_whispercpp_model(args.whispercpp_model, args.model)  # 评估模型文件。
     print_kv("whisper.cpp 可执行", exec_path or "<未提供>")  # 输出可执行路径。
     print_kv("EXEC STATUS", exec_status)  # 输出状态。
@@ -447,6 +586,28 @@ def main() -> None:
     print("OK: 验证结束，退出码始终为 0。")  # 提醒脚本会以 0 退出。
 
 
+
+def main() -> None:
+    """脚本主入口，输出完整体检报告；报告先写入内存缓冲，避免逐行 print 触发大量 write 系统调用。"""  # 函数说明。
+    import contextlib  # 延迟导入 contextlib 以重定向标准输出。
+    import io  # 延迟导入 io 以创建内存缓冲。
+
+    stdout = sys.stdout  # 记录真实标准输出。
+    buffer = io.StringIO()  # 报告缓冲区。
+
+    def flush() -> None:
+        stdout.write(buffer.getvalue())  # 一次性写出缓冲内容。
+        stdout.flush()  # 确保立即可见。
+        buffer.seek(0)  # 回到起点。
+        buffer.truncate()  # 清空已输出部分。
+
+    try:  # 无论正常结束、--help 还是异常，都输出已缓冲的报告。
+        with contextlib.redirect_stdout(buffer):  # 将报告中的 print 写入缓冲。
+            run_report(flush)  # 执行全部检查。
+    finally:
+        flush()  # 输出剩余内容。
+
+
 if __name__ == "__main__":  # 当脚本直接执行时。
     main()  # 运行主函数。
     sys.exit(0)  # 显式以 0 退出。
@@ -9,12 +9,19 @@ PROJECT_ROOT = Path(__file__).resolve().parent
 VERSION = (PROJECT_ROOT / "VERSION").read_text(encoding="utf-8").split()[0]
 # 注释：读取 README 作为长描述，兼容 PyPI 展示
 LONG_DESCRIPTION = (PROJECT_ROOT / "README.md").read_text(encoding="utf-8")
-# 注释：解析运行时依赖，忽略注释与空行
-INSTALL_REQUIRES = [
-    line.strip()
-    for line in (PROJECT_ROOT / "requirements.txt").read_text(encoding="utf-8").splitlines()
-    if line.strip() and not line.startswith("#")
-]
+
+
+# 注释：逐行产出运行时依赖，每行只 strip 一次
+def _reqs():
+    """逐行产出 requirements.txt 中的依赖，忽略注释与空行。"""
+    for line in (PROJECT_ROOT / "requirements.txt").read_text(encoding="utf-8").splitlines():
+        stripped = line.strip()  # 注释：每行只做一次 strip
+        if stripped and stripped[0] != "#":  # 注释：按去空白后的首字符判断注释行
+            yield stripped
+
+
+# 注释：物化依赖列表供 setup() 使用
+INSTALL_REQUIRES = list(_reqs())
 
 # 注释：调用 setup() 声明包元信息
 setup(
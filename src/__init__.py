@@ -1,6 +1,15 @@
 """Top-level package for the ASRProgram application."""
 
-# Re-export commonly used namespaces for convenience when running as a module.
-from . import asr, cli, utils  # noqa: F401
+import importlib
 
 __all__ = ["asr", "cli", "utils"]
+
+
+# Re-export the subpackages lazily (PEP 562) so that importing e.g. ``src.utils.config``
+# does not also pull in the CLI, the pipeline and the ASR backends.
+def __getattr__(name):
+    if name in __all__:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
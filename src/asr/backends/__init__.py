@@ -1,31 +1,50 @@
 """后端注册表，用于根据名称返回具体实现。"""
+# 导入 importlib 以在首次使用时按需加载后端模块。
+import importlib
 # 导入 typing.TYPE_CHECKING 用于仅在类型检查时导入接口。
-from typing import TYPE_CHECKING, Dict, Type
-# 导入 dummy 后端以注册。
-from .dummy import DummyTranscriber
-# 导入 faster-whisper 后端以注册。
-from .faster_whisper_backend import FasterWhisperTranscriber
-# 如果处于类型检查阶段，导入接口定义以提供准确提示。
+from typing import TYPE_CHECKING, Any, Dict, Tuple, Type
+# 如果处于类型检查阶段，导入接口定义与具体实现以提供准确提示。
 if TYPE_CHECKING:
     from .base import ITranscriber
+    from .dummy import DummyTranscriber
+    from .faster_whisper_backend import FasterWhisperTranscriber
 
-# 定义一个字典，映射后端名称到具体类，后续新增后端时在此注册。
-BACKENDS: Dict[str, Type["ITranscriber"]] = {
+# 定义一个字典，映射后端名称到 (模块名, 类名)，后续新增后端时在此注册。
+# 仅记录字符串而不导入实现，使 create_transcriber("dummy") 等调用无需加载其他后端的依赖。
+BACKENDS: Dict[str, Tuple[str, str]] = {
     # dummy 名称对应 DummyTranscriber 类。
-    "dummy": DummyTranscriber,
+    "dummy": (".dummy", "DummyTranscriber"),
     # faster-whisper 名称对应真实的 faster-whisper 实现。
-    "faster-whisper": FasterWhisperTranscriber,
+    "faster-whisper": (".faster_whisper_backend", "FasterWhisperTranscriber"),
 }
 
-# 提供工厂函数，根据名称创建后端实例并透传额外参数。
-def create_transcriber(name: str, **kwargs) -> "ITranscriber":
-    """根据后端名称返回对应的转写器实例。"""
-    # 尝试在注册表中查找给定名称。
-    if name not in BACKENDS:
+
+def load_backend(name: str) -> Type["ITranscriber"]:
+    """根据后端名称导入并返回实现类。"""
+    # 在注册表中仅查找一次给定名称。
+    entry = BACKENDS.get(name)
+    if entry is None:
         # 若不存在，抛出带详细信息的错误，提示如何扩展。
         raise ValueError(
             f"Unsupported backend '{name}'. Available options: {', '.join(BACKENDS)}"
         )
+    module_name, class_name = entry
+    # importlib 会复用 sys.modules 中已加载的模块，重复调用只剩字典查找。
+    return getattr(importlib.import_module(module_name, __name__), class_name)
+
+
+# 提供工厂函数，根据名称创建后端实例并透传额外参数。
+def create_transcriber(name: str, **kwargs) -> "ITranscriber":
+    """根据后端名称返回对应的转写器实例。"""
     # 找到对应类后实例化并返回，kwargs 可包含语言、模型等配置。
-    return BACKENDS[name](**kwargs)
+    return load_backend(name)(**kwargs)
+
+
+# 兼容旧的 `from src.asr.backends import DummyTranscriber` 写法，按需导入实现类（PEP 562）。
+_EXPORTS = {class_name: backend for backend, (_, class_name) in BACKENDS.items()}
+
 
+def __getattr__(name: str) -> Any:
+    if name in _EXPORTS:
+        return load_backend(_EXPORTS[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -8,6 +8,9 @@ from typing import Any, Dict
 class ITranscriber(ABC):
     """约定构造参数与文件级转写方法的抽象基类。"""
 
+    # 公共属性固定为三项，使用 __slots__ 省去实例字典；未声明 __slots__ 的子类仍会获得 __dict__。
+    __slots__ = ("model_name", "language", "extra_options")
+
     # 定义初始化函数，统一保存模型、语言与额外配置。
     def __init__(
         self,
@@ -3,8 +3,10 @@
 from datetime import datetime, timezone
 # 导入 pathlib.Path 便于处理文件路径。
 from pathlib import Path
-# 导入 typing 的 List 类型以进行类型注释。
-from typing import List
+# 导入 time 以按整秒判断时间戳缓存是否失效。
+import time
+# 导入 typing 的 Any 与 List 类型以进行类型注释。
+from typing import Any, List
 # 从同目录的 base 模块导入接口基类。
 from .base import ITranscriber
 
@@ -12,11 +14,48 @@ from .base import ITranscriber
 DUMMY_NAME = "dummy"
 # 定义占位后端的版本号。
 DUMMY_VERSION = "0.1.0"
+# 预构建文件名分隔符到空格的映射表，供 str.translate 复用。
+_SEPARATOR_TABLE = str.maketrans("_-", "  ")
+# 缓存最近一次格式化的 (整秒, 时间戳字符串)，以元组整体替换保证线程间读取一致。
+_LAST_TIMESTAMP = (0, "")
+
+
+def _now_iso() -> str:
+    """返回精确到秒的 UTC ISO 时间戳，同一秒内的调用复用同一字符串。"""
+    global _LAST_TIMESTAMP
+    # 取当前整秒作为缓存键。
+    second = int(time.time())
+    cached_second, cached_text = _LAST_TIMESTAMP
+    if cached_second != second:
+        # 秒数变化时重新格式化，与 pipeline 中 generated_at 的格式保持一致。
+        cached_text = (
+            datetime.fromtimestamp(second, timezone.utc)
+            .isoformat()
+            .replace("+00:00", "Z")
+        )
+        _LAST_TIMESTAMP = (second, cached_text)
+    return cached_text
+
 
 # 定义实际的转写器类，继承抽象基类。
 class DummyTranscriber(ITranscriber):
     """返回基于文件名生成的段级与词级占位结构。"""
 
+    # 仅新增后端描述模板一个属性，继续沿用基类的 __slots__ 布局。
+    __slots__ = ("_backend_info",)
+
+    # 初始化时预先构造不随调用变化的后端信息。
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """保存公共属性并准备后端描述模板。"""
+        # 先由基类保存模型、语言与扩展参数。
+        super().__init__(*args, **kwargs)
+        # 后端名称、版本与模型在实例生命周期内固定，每次转写只需浅拷贝。
+        self._backend_info = {
+            "name": DUMMY_NAME,
+            "version": DUMMY_VERSION,
+            "model": self.model_name or "synthetic",
+        }
+
     # 实现抽象方法 transcribe_file。
     def transcribe_file(self, input_path: str) -> dict:
         """根据输入文件名构造模拟的转写结果。"""
@@ -24,10 +63,8 @@ class DummyTranscriber(ITranscriber):
         file_path = Path(input_path)
         # 获取不含扩展名的基本名称。
         basename = file_path.stem
-        # 将文件名中的分隔符替换为空格以便拆分词语。
-        normalized = basename.replace("_", " ").replace("-", " ")
-        # 将名称按空格拆分，过滤空白片段。
-        tokens: List[str] = [part for part in normalized.split() if part]
+        # 单次 translate 将分隔符替换为空格，无参 split 不会产生空片段。
+        tokens: List[str] = basename.translate(_SEPARATOR_TABLE).split()
         # 如果拆分结果不足两个词，补充占位词保证 2~3 个。
         if len(tokens) < 2:
             # 若完全没有词，使用 generic 作为占位。
@@ -68,29 +105,15 @@ class DummyTranscriber(ITranscriber):
                 "words": word_items,
             }
         ]
-        # 构造顶层元数据，包含语言、时长与后端信息。
-        metadata = {
+        # 直接构造统一接口结构，后端信息复制自初始化时准备好的模板。
+        return {
             "language": self.language,
             "duration_sec": 0.0,
-            "backend": {
-                "name": DUMMY_NAME,
-                "version": DUMMY_VERSION,
-                "model": self.model_name or "synthetic",
-            },
+            "backend": dict(self._backend_info),
+            "segments": segments,
+            "words": word_items,
             "meta": {
                 "note": "placeholder for round 3",
-                "generated_at": datetime.now(timezone.utc)
-                .isoformat()
-                .replace("+00:00", "Z"),
+                "generated_at": _now_iso(),
             },
         }
-        # 返回符合统一接口的占位结果结构。
-        return {
-            "language": metadata["language"],
-            "duration_sec": metadata["duration_sec"],
-            "backend": metadata["backend"],
-            "segments": segments,
-            "words": word_items,
-            "meta": metadata["meta"],
-        }
-
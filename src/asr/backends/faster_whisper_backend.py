@@ -4,14 +4,22 @@
 from dataclasses import asdict  # noqa: F401
 # 导入 dataclasses.dataclass 用于声明轻量配置数据结构。 
 from dataclasses import dataclass  # noqa: F401
+# 导入 itertools.accumulate 以在降级切分时计算长度前缀和。 
+from itertools import accumulate  # noqa: F401
+# 导入 gc 以在大文件之间按需触发循环垃圾回收。 
+import gc  # noqa: F401
 # 导入 logging 以输出调试日志与降级提示。 
 import logging  # noqa: F401
 # 导入 math 以在置信度降级时执行指数运算。 
 import math  # noqa: F401
+# 导入 os 以读取 CPU 亲和性与线程数环境变量。 
+import os  # noqa: F401
 # 导入 pathlib.Path 统一处理文件路径。 
 from pathlib import Path  # noqa: F401
-# 导入 typing 中的 Dict、List、Optional 以提供清晰的类型注释。 
-from typing import Dict, List, Optional  # noqa: F401
+# 导入 threading 以保护进程内共享的模型缓存。 
+import threading  # noqa: F401
+# 导入 typing 中的常用类型以提供清晰的类型注释。 
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple  # noqa: F401
 
 # 导入音频工具函数，复用扩展名校验与时长探测逻辑。 
 from src.utils.audio import is_audio_path, probe_duration  # noqa: F401
@@ -24,10 +32,81 @@ from .base import ITranscriber  # noqa: F401
 LOGGER = logging.getLogger(__name__)
 # 定义浮点误差上限，在修正时间戳时复用。 
 EPSILON = 1e-3
+# compute_type=auto 时按设备选用的默认精度：CPU 走 CTranslate2 的 int8 GEMM，CUDA 采用 int8 权重 + fp16 计算。 
+AUTO_COMPUTE_TYPES = {"cpu": "int8", "cuda": "int8_float16"}
+# 允许通过环境变量固定 CTranslate2 的 CPU 线程数（多进程部署时可设为 1 避免超额订阅）。 
+CPU_THREADS_ENV = "FW_CPU_THREADS"
+# 进程内的 WhisperModel 缓存，键为 (模型路径或名称, device, compute_type, cpu_threads, num_workers)，避免重复加载数 GB 权重。 
+_MODEL_CACHE: Dict[Tuple[str, str, str, int, int], Any] = {}
+# 保护模型缓存的锁；持锁加载可防止并发实例重复加载同一模型。 
+_MODEL_CACHE_LOCK = threading.Lock()
 
 
-# 使用 dataclass 封装推理参数，便于序列化存档。 
-@dataclass
+def _resolve_cpu_threads(cpu_threads: int | None, num_workers: int) -> int:
+    """确定每个模型 worker 的 CPU 线程数，使所有 worker 合计恰好占满可用核心。"""  # 函数说明。
+    # 显式参数优先，其次读取环境变量。
+    if cpu_threads is None:
+        env_value = os.environ.get(CPU_THREADS_ENV, "").strip()
+        if env_value:
+            try:
+                cpu_threads = int(env_value)
+            except ValueError:
+                LOGGER.warning("忽略无效的 %s=%r", CPU_THREADS_ENV, env_value)
+    if cpu_threads is not None:
+        return max(0, cpu_threads)
+    # 优先使用进程 CPU 亲和性（容器/taskset 限制），不可用时回退到逻辑核数。
+    try:
+        available = len(os.sched_getaffinity(0))
+    except AttributeError:
+        available = os.cpu_count() or 1
+    # 并发 worker 平分核心，避免多个解码流互相抢占。
+    return max(1, available // max(1, num_workers))
+
+
+def _load_whisper_model(
+    model_cls: Any,
+    model_path: str,
+    device: str,
+    compute_type: str,
+    cpu_threads: int = 0,
+    num_workers: int = 1,
+) -> Any:
+    """返回缓存中的 WhisperModel，未命中时加载并写入缓存。"""  # 函数说明。
+    key = (model_path, device, compute_type, cpu_threads, num_workers)
+    with _MODEL_CACHE_LOCK:
+        model = _MODEL_CACHE.get(key)
+        if model is None:
+            # 加载失败时异常直接上抛，不会写入缓存。
+            model = model_cls(
+                model_path,
+                device=device,
+                compute_type=compute_type,
+                cpu_threads=cpu_threads,
+                num_workers=num_workers,
+            )
+            _MODEL_CACHE[key] = model
+        return model
+
+
+def _resolve_compute_type(device: str, compute_type: str) -> str:
+    """将 compute_type=auto 解析为具体精度，显式指定的取值原样返回。"""  # 函数说明。
+    # 调用方显式指定精度时尊重其选择（例如固定 float16）。
+    if compute_type != "auto":
+        return compute_type
+    # device=auto 时通过 CTranslate2 判断是否存在可用 GPU；无法探测时按 CPU 处理。
+    if device == "auto":
+        try:
+            import ctranslate2  # type: ignore[import-not-found]
+
+            device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+        except Exception:  # noqa: BLE001
+            device = "cpu"
+    # 未知设备保持 auto，交由 CTranslate2 自行决策。
+    return AUTO_COMPUTE_TYPES.get(device, compute_type)
+
+
+# 使用 dataclass 封装推理参数，便于序列化存档；构造后不再修改，故声明为 frozen。 
+@dataclass(frozen=True)
 class DecodeOptions:
     """保存传给 faster-whisper 的主要解码设置。"""  # 数据类说明。
 
@@ -35,7 +114,7 @@ class DecodeOptions:
     beam_size: int
     # 温度参数，控制采样多样性（当前默认 0）。
     temperature: float
-    # 是否启用 VAD 过滤（本轮仅记录）。
+    # 是否启用 Silero VAD，在解码前跳过静音片段。
     vad_filter: bool
     # 分块长度（秒），None 表示采用默认值。
     chunk_length_s: Optional[float]
@@ -43,6 +122,12 @@ class DecodeOptions:
     best_of: Optional[int]
     # patience 参数用于 beam search 的提前停止阈值，占位记录。
     patience: Optional[float]
+    # VAD 判定为段落间静音所需的最短时长（毫秒），仅在启用 VAD 时生效。
+    vad_min_silence_ms: Optional[int] = None
+    # VAD 语音概率阈值，高于该值的帧视为语音。
+    vad_threshold: Optional[float] = None
+    # 是否启用快速模式（贪心解码且不以前文为条件）。
+    fast_mode: bool = False
 
 
 # 定义专用异常，帮助上层区分 faster-whisper 的初始化或推理问题。 
@@ -63,10 +148,16 @@ class FasterWhisperTranscriber(ITranscriber):
         device: str = "auto",
         beam_size: int = 5,
         temperature: float = 0.0,
-        vad_filter: bool = False,
+        vad_filter: bool = True,
+        vad_min_silence_ms: int = 500,
+        vad_threshold: float = 0.5,
         chunk_length_s: float | None = None,
         best_of: int | None = None,
         patience: float | None = None,
+        cpu_threads: int | None = None,
+        num_workers: int = 1,
+        fast_mode: bool = False,
+        release_memory: bool = False,
         **kwargs,
     ) -> None:
         """导入 faster-whisper、加载模型并记录推理选项。"""  # 构造函数说明。
@@ -82,15 +173,29 @@ class FasterWhisperTranscriber(ITranscriber):
             ) from exc
         # 将 faster-whisper 版本保存到实例属性，以便输出到 JSON 元信息中。
         self.faster_whisper_version: str = fw_version
+        # 将 auto 解析为设备对应的具体精度（int8 的 WER 回退可忽略），后续加载与元信息均使用解析结果。
+        compute_type = _resolve_compute_type(device, compute_type)
         # 记录 compute_type，便于 verbose 日志与元信息展示。
         self.compute_type: str = compute_type
         # 记录设备配置，允许 auto/cpu/cuda 等取值。
         self.device: str = device
+        # 记录是否在每个文件结束后主动回收内存，适用于内存预算紧张的长时运行场景。
+        self.release_memory: bool = bool(release_memory)
+        # num_workers 对应可并发调用 transcribe() 的解码流数量，应与上层并发度一致。
+        num_workers = max(1, int(num_workers or 1))
+        # 解析 CTranslate2 的 CPU 线程数（参数 > FW_CPU_THREADS > 可用核心数 / num_workers）。
+        cpu_threads = _resolve_cpu_threads(cpu_threads, num_workers)
         # 若未指定模型名称，则回退到 medium（与默认配置一致）。
         if self.model_name is None:
             self.model_name = "medium"
         # 解析模型名称或路径，优先返回本地目录的绝对路径。
         resolved_model = self._resolve_model_path(self.model_name)
+        # 快速模式：batch=1 时解码耗时近似随 beam 宽度线性增长，改用贪心解码并关闭跨段条件以换取延迟。
+        if fast_mode:
+            beam_size = 1
+            best_of = 1
+            patience = None
+            temperature = 0.0
         # 将核心解码参数封装成数据类，后续写入 meta 供审计。
         self.decode_options = DecodeOptions(
             beam_size=beam_size,
@@ -99,25 +204,33 @@ class FasterWhisperTranscriber(ITranscriber):
             chunk_length_s=chunk_length_s,
             best_of=best_of,
             patience=patience,
+            vad_min_silence_ms=vad_min_silence_ms if vad_filter else None,
+            vad_threshold=vad_threshold if vad_filter else None,
+            fast_mode=fast_mode,
         )
-        # 预构建传递给 transcribe() 的参数字典，过滤 None 以避免覆盖默认行为。
-        self._transcribe_kwargs = {
+        # 解码选项构造后不变，预先转换为字典，避免每次转写都经 asdict() 深拷贝。
+        self._decode_options_dict = asdict(self.decode_options)
+        # 预构建传递给 transcribe() 的参数字典，候选项见下方。
+        transcribe_kwargs = {
             "beam_size": beam_size,
             "temperature": temperature,
             "vad_filter": vad_filter,
-            "vad_parameters": None,  # Round 8 仍未开放自定义 VAD 细节。
+            # 启用 VAD 时传入静音时长与阈值，未启用时为 None 并在下方过滤。
+            "vad_parameters": (
+                {"min_silence_duration_ms": vad_min_silence_ms, "threshold": vad_threshold} if vad_filter else None
+            ),
             "chunk_length": chunk_length_s,
             "best_of": best_of,
             "patience": patience,
-            "condition_on_previous_text": True,  # 保持跨段上下文一致性。
+            "condition_on_previous_text": not fast_mode,  # 常规模式保持跨段上下文一致性，快速模式省去该开销。
             "word_timestamps": True,  # 关键设置：启用词级时间戳。
         }
-        # 尝试构造 WhisperModel，如失败则给出模型路径与 compute_type 的排障建议。
+        # 构造时一次性过滤 None 以避免覆盖默认行为，转写时直接展开，无需逐文件重建字典。
+        self._transcribe_kwargs = {k: v for k, v in transcribe_kwargs.items() if v is not None}
+        # 尝试构造（或从缓存复用）WhisperModel，如失败则给出模型路径与 compute_type 的排障建议。
         try:
-            self._model = WhisperModel(
-                resolved_model,
-                device=device,
-                compute_type=compute_type,
+            self._model = _load_whisper_model(
+                WhisperModel, resolved_model, device, compute_type, cpu_threads, num_workers
             )
         except Exception as exc:  # noqa: BLE001
             # 如果 GPU 初始化失败，尝试自动回退到 CPU/INT8 组合，兼容无 CUDA 环境。
@@ -138,10 +251,13 @@ class FasterWhisperTranscriber(ITranscriber):
                     fallback_compute_type or compute_type,
                 )
                 try:
-                    self._model = WhisperModel(
+                    self._model = _load_whisper_model(
+                        WhisperModel,
                         resolved_model,
-                        device=fallback_device or device,
-                        compute_type=fallback_compute_type or compute_type,
+                        fallback_device or device,
+                        fallback_compute_type or compute_type,
+                        cpu_threads,
+                        num_workers,
                     )
                 except Exception as fallback_exc:  # noqa: BLE001
                     raise FasterWhisperBackendError(
@@ -166,11 +282,23 @@ class FasterWhisperTranscriber(ITranscriber):
         self.model_path_or_name = str(resolved_model)
         # 在详细日志模式下给出性能调优建议，帮助用户选择合适的 compute_type。
         LOGGER.debug(
-            "FasterWhisper 模型加载完成 model=%s device=%s compute_type=%s", self.model_path_or_name, device, compute_type
+            "FasterWhisper 模型加载完成 model=%s device=%s compute_type=%s cpu_threads=%s num_workers=%s",
+            self.model_path_or_name,
+            device,
+            compute_type,
+            cpu_threads,
+            num_workers,
         )
         LOGGER.debug("提示: compute_type='int8_float16' 能显著降低内存占用；Apple Silicon 可尝试 'float16'。")
         LOGGER.debug("如在 Windows CPU 上速度较慢，可将 compute_type 设为 'int8' 并将 beam_size 调小。")
 
+    # 提供清空模型缓存的入口，便于测试或释放显存。
+    @classmethod
+    def clear_model_cache(cls) -> None:
+        """丢弃进程内缓存的全部 WhisperModel 实例。"""  # 方法说明。
+        with _MODEL_CACHE_LOCK:
+            _MODEL_CACHE.clear()
+
     # 提供内部辅助函数，用于判断模型名称是否指向本地路径。
     def _resolve_model_path(self, model_name: str) -> str:
         """返回 WhisperModel 可接受的模型名称或绝对路径。"""  # 函数说明。
@@ -288,51 +416,49 @@ class FasterWhisperTranscriber(ITranscriber):
                     }
                 )
             return generated, False
-        # 根据词的长度按比例分配时间片，字符越多占比越大。
+        # 根据词的长度按比例分配时间片，字符越多占比越大；每个词至少计 1，总长度必为正。
         lengths = [max(len(token), 1) for token in words]
-        total = float(sum(lengths))
-        # 避免除零错误，如总长度为 0 则等分时间。
-        if total <= 0:
-            total = float(len(words))
-            lengths = [1.0] * len(words)
-        # 构建累计时间，确保单调。
-        generated_words: List[dict] = []
-        cursor = segment_start
-        clipped = False
-        for idx, (token, length) in enumerate(zip(words, lengths)):
-            # 计算该词占用的时间比例。
-            proportion = float(length) / total
-            # 对最后一个词强制对齐段末，以避免浮点累计误差。
-            if idx == len(words) - 1:
-                start_time = cursor
-                end_time = segment_end
-            else:
-                span = duration * proportion
-                start_time = cursor
-                end_time = min(segment_end, cursor + span)
-            # 若出现数值误差导致起点超过终点，则进行修正。
-            if end_time < start_time:
-                end_time = start_time
-                clipped = True
-            # 将当前词写入结果列表。
-            generated_words.append(
-                {
-                    "text": token,
-                    "start": start_time,
-                    "end": end_time,
-                    "confidence": fallback_conf,
-                    "segment_id": segment_id,
-                    "index": idx,
-                }
-            )
-            # 更新游标，确保下一词时间递增。
-            cursor = end_time
-        # 返回生成的词列表以及是否发生裁剪。
-        return generated_words, clipped
+        scale = duration / sum(lengths)
+        # 由长度前缀和一次求出各词的结束边界，避免逐词累加游标带来的浮点漂移。
+        ends = [min(segment_end, segment_start + acc * scale) for acc in accumulate(lengths)]
+        # 最后一个词强制对齐段末；前缀和单调递增，因此无需再做逆序修正。
+        ends[-1] = segment_end
+        starts = [segment_start, *ends[:-1]]
+        generated_words = [
+            {
+                "text": token,
+                "start": start_time,
+                "end": end_time,
+                "confidence": fallback_conf,
+                "segment_id": segment_id,
+                "index": idx,
+            }
+            for idx, (token, start_time, end_time) in enumerate(zip(words, starts, ends))
+        ]
+        # 返回生成的词列表；按比例分配不会产生裁剪。
+        return generated_words, False
 
     # 实现 ITranscriber 约定的文件转写逻辑，输出段级结构。
     def transcribe_file(self, input_path: str) -> Dict[str, object]:
         """调用 faster-whisper 对音频文件进行写并生成段/词级 JSON 结构。"""  # 函数说明。
+        # 校验路径后直接推理；时长优先取自解码器，仅在缺失时才调用 ffprobe。
+        try:
+            return self._transcribe_path(self._validate_audio_path(input_path))
+        finally:
+            # 启用 release_memory 时立即回收本文件遗留的循环引用对象，而非等待 GC 阈值触发。
+            if self.release_memory:
+                gc.collect()
+
+    # 批量转写：在同一模型上按顺序处理多个文件。
+    def transcribe_files(self, input_paths: Iterable[str]) -> Iterator[Dict[str, object]]:
+        """按输入顺序逐个产出转写结果。"""  # 函数说明。
+        for input_path in input_paths:
+            # 校验失败与单文件接口一致地抛出 FasterWhisperBackendError。
+            yield self.transcribe_file(input_path)
+
+    # 校验输入路径存在且扩展名受支持。
+    def _validate_audio_path(self, input_path: str | Path) -> Path:
+        """返回校验通过的 Path，否则抛出 FasterWhisperBackendError。"""  # 函数说明。
         # 将字符串路径包装为 Path 对象以执行常规校验。
         file_path = Path(input_path)
         # 如果文件不存在，则抛出明确错误，由上层写入 error.txt。
@@ -341,8 +467,11 @@ class FasterWhisperTranscriber(ITranscriber):
         # 通过工具函数校验扩展名，避免非音频文件导致推理异常。
         if not is_audio_path(file_path):
             raise FasterWhisperBackendError(f"不支持的音频扩展名: {file_path.suffix}")
-        # 通过 ffprobe 探测真实时长，若失败将返回 0.0 并在日志中提示。
-        duration = probe_duration(file_path)
+        return file_path
+
+    # 对已校验的音频执行推理并组装统一结构。
+    def _transcribe_path(self, file_path: Path) -> Dict[str, object]:
+        """转写单个已校验文件。"""  # 函数说明。
         # 处理语言参数：auto/空字符串代表交由模型自动检测。
         language_arg = None if self.language in (None, "", "auto") else self.language
         try:  # 捕获底层解码失败并提供降级结构。
@@ -350,23 +479,29 @@ class FasterWhisperTranscriber(ITranscriber):
             segments_iter, info = self._model.transcribe(
                 str(file_path),
                 language=language_arg,
-                **{k: v for k, v in self._transcribe_kwargs.items() if v is not None},
+                **self._transcribe_kwargs,
             )
         except Exception as exc:  # noqa: BLE001  # 任意异常均视为无法解码该音频。
             LOGGER.warning("faster-whisper fallback for %s: %s", file_path, exc)  # 打印警告便于排查。
-            return self._build_fallback_result(duration, language_arg, exc)  # 返回兼容结构的占位结果。
-        # 将生成器转换为列表，便于多次遍历并序列化为 JSON。
-        segments = list(segments_iter)
+            # 解码失败时无解码器时长可用，改由 ffprobe 探测（失败时为 0.0）。
+            return self._build_fallback_result(probe_duration(file_path), language_arg, exc)  # 返回兼容结构的占位结果。
+        # faster-whisper 解码音频时已得到时长（info.duration），可省去每个文件一次 ffprobe 子进程。
+        duration = float(getattr(info, "duration", 0.0) or 0.0)
+        duration_source = "decoder"
+        if duration <= 0:
+            # 旧版本或异常情况下缺少该字段时回退到 ffprobe。
+            duration = probe_duration(file_path)
+            duration_source = "ffprobe"
         # 推断语言：优先使用模型检测结果，其次使用手动指定。
         detected_language = getattr(info, "language", None) or self.language
         # 准备收集所有段级结构与词级结构。
         normalized_segments: List[Dict[str, object]] = []
         all_words: List[Dict[str, object]] = []
-        # 记录是否出现词时间被裁剪或使用降级策略，便于写入 meta。
-        clipped_segments: List[int] = []
-        fallback_segments: List[int] = []
-        # 遍历每个段对象，转换为统一结构。
-        for segment in segments:
+        # 记录出现词时间裁剪或降级策略的段 id；用集合收集，同段多个词被裁剪时只保留一份。
+        clipped_segments: Set[int] = set()
+        fallback_segments: Set[int] = set()
+        # 直接消费惰性生成器，边解码边规范化，无需先物化全部原始段对象。
+        for segment in segments_iter:
             # 解析段级字段并确保类型统一。
             segment_id = int(getattr(segment, "id", len(normalized_segments)))
             segment_start = float(getattr(segment, "start", 0.0) or 0.0)
@@ -383,14 +518,17 @@ class FasterWhisperTranscriber(ITranscriber):
             last_end = segment_start
             # 标记当前段是否需要降级。
             used_fallback = False
-            # 遍历词对象并规范化。
-            for idx, word_obj in enumerate(segment_words_raw):
+            # 在规范化循环中顺带累计词级置信度，省去事后再遍历一次词表。
+            conf_total = 0.0
+            conf_count = 0
+            # 遍历词对象并规范化；索引取已保留词数，跳过空词后仍自 0 连续。
+            for word_obj in segment_words_raw:
                 normalized_word, last_end, clipped, _ = self._normalize_word(
                     word_obj,
                     segment_start,
                     segment_end,
                     segment_id,
-                    idx,
+                    len(segment_words),
                     segment_confidence,
                     detected_language,
                     last_end,
@@ -398,7 +536,11 @@ class FasterWhisperTranscriber(ITranscriber):
                 if normalized_word is None:
                     continue
                 if clipped:
-                    clipped_segments.append(segment_id)
+                    clipped_segments.add(segment_id)
+                confidence = normalized_word["confidence"]
+                if confidence is not None:
+                    conf_total += confidence
+                    conf_count += 1
                 segment_words.append(normalized_word)
             # 若模型未返回词级结果，则执行降级切分。
             if not segment_words:
@@ -414,29 +556,16 @@ class FasterWhisperTranscriber(ITranscriber):
                     segment_words = fallback_words
                     used_fallback = True
                     if clipped:
-                        clipped_segments.append(segment_id)
+                        clipped_segments.add(segment_id)
                 if used_fallback:
-                    fallback_segments.append(segment_id)
-            # 在词数组存在时校验单调性并做微调。
-            if segment_words:
-                previous_end = segment_start
-                for word in segment_words:
-                    if word["start"] < previous_end - EPSILON:
-                        word["start"] = previous_end
-                    if word["end"] < word["start"]:
-                        word["end"] = word["start"]
-                    previous_end = word["end"]
-            # 更新词索引，使其在段内连续且自 0 起步。
-            for new_idx, word in enumerate(segment_words):
-                word["index"] = new_idx
+                    fallback_segments.add(segment_id)
+            # _normalize_word 以 last_end 推进、降级切分以游标推进，两条路径产出的词已单调且索引连续，无需再次遍历修正。
             # 将段内词汇追加到总词表中。
             all_words.extend(segment_words)
-            # 计算段级平均置信度，若词级存在则取均值。
-            confidences = [w["confidence"] for w in segment_words if w.get("confidence") is not None]
-            avg_conf = None
-            if confidences:
-                avg_conf = sum(confidences) / len(confidences)
-            elif segment_confidence is not None:
+            # 计算段级平均置信度：词级置信度存在时取均值；降级词均沿用段级置信度，均值即为其本身。
+            if conf_count:
+                avg_conf = conf_total / conf_count
+            else:
                 avg_conf = segment_confidence
             # 将段对象转换为字典并附带词数组。
             normalized_segments.append(
@@ -459,12 +588,13 @@ class FasterWhisperTranscriber(ITranscriber):
         }
         # 组装元数据：包含检测到的语言、探测时长与解码参数以及词级状态。
         meta = {
-            "decode_options": asdict(self.decode_options),
+            "decode_options": dict(self._decode_options_dict),
             "detected_language": getattr(info, "language", None),
             "duration_from_probe": duration,
+            "duration_source": duration_source,
             "note": "generated by faster-whisper round8",
-            "word_time_clipped_segments": sorted(set(clipped_segments)),
-            "word_fallback_segments": sorted(set(fallback_segments)),
+            "word_time_clipped_segments": sorted(clipped_segments),
+            "word_fallback_segments": sorted(fallback_segments),
         }
         # 返回统一结构，供 pipeline 落盘使用；包含段级与词级数组。
         return {
@@ -503,7 +633,7 @@ class FasterWhisperTranscriber(ITranscriber):
             }
         ]
         meta = {  # 汇总元信息并保留解码参数与错误描述。
-            "decode_options": asdict(self.decode_options),
+            "decode_options": dict(self._decode_options_dict),
             "detected_language": detected_language,
             "duration_from_probe": duration,
             "note": "generated by faster-whisper fallback",
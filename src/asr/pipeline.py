@@ -179,16 +179,14 @@ def _build_payloads(
     audio_hash: str | None,
 ) -> Tuple[Dict[str, Any], Dict[str, Any] | None, float, int, int]:
     """依据后端结果构建 words/segments JSON 结构并返回统计信息。"""  # 函数说明。
-    raw_words = [dict(word) for word in transcription.get("words", [])]  # 拷贝词数组。
-    fixed_words, adjustments = _ensure_word_monotonicity(raw_words)  # 修正逆序时间。
+    # _ensure_word_monotonicity 会逐条拷贝词条，此处无需预先复制一份。
+    fixed_words, adjustments = _ensure_word_monotonicity(transcription.get("words", []))  # 修正逆序时间。
     segments_data = []  # 初始化段级数据容器。
     for segment in transcription.get("segments", []):
         segment_copy = dict(segment)  # 拷贝段数据。
-        segment_copy["words"] = [dict(word) for word in segment_copy.get("words", [])]  # 深拷贝子词条。
+        segment_copy["words"] = []  # 段内词条稍后由修正后的词数组回填，不再拷贝原始词条。
         segments_data.append(segment_copy)  # 添加到列表。
     segment_lookup = {segment.get("id"): segment for segment in segments_data}  # 建立段 id 索引。
-    for segment in segments_data:
-        segment["words"] = []  # 预先清空 words 字段。
     for word in fixed_words:
         segment = segment_lookup.get(word.get("segment_id"))  # 查找词所属段。
         if segment is None:
@@ -782,7 +780,11 @@ def _run_impl(
         "device": "auto",
         "beam_size": 5,
         "temperature": 0.0,
-        "vad_filter": False,
+        "vad_filter": True,
+        "vad_min_silence_ms": 500,
+        "vad_threshold": 0.5,
+        "fast_mode": False,
+        "release_memory": False,
         "chunk_length_s": None,
         "best_of": None,
         "patience": None,
@@ -811,6 +813,10 @@ def _run_impl(
     temperature_value = runtime_cfg.get("temperature")  # 温度原始值。
     temperature = float(temperature_value if temperature_value is not None else 0.0)  # 归一化温度。
     vad_filter = bool(runtime_cfg.get("vad_filter"))  # VAD 开关。
+    vad_min_silence_ms = int(runtime_cfg.get("vad_min_silence_ms"))  # VAD 最短静音时长（毫秒）。
+    vad_threshold = float(runtime_cfg.get("vad_threshold"))  # VAD 语音概率阈值。
+    fast_mode = bool(runtime_cfg.get("fast_mode"))  # 快速模式（贪心解码）。
+    release_memory = bool(runtime_cfg.get("release_memory"))  # 每个文件后主动回收内存。
     chunk_value = runtime_cfg.get("chunk_length_s")  # 分段长度。
     chunk_length_s = float(chunk_value) if chunk_value is not None else None  # 归一化为浮点数。
     best_of_value = runtime_cfg.get("best_of")  # 采样候选数。
@@ -904,9 +910,14 @@ def _run_impl(
         "beam_size": beam_size,
         "temperature": temperature,
         "vad_filter": vad_filter,
+        "vad_min_silence_ms": vad_min_silence_ms,
+        "vad_threshold": vad_threshold,
+        "fast_mode": fast_mode,
+        "release_memory": release_memory,
         "chunk_length_s": chunk_length_s,
         "best_of": best_of,
         "patience": patience,
+        "num_workers": num_workers,  # 模型侧并发解码流与 worker 数一致，CPU 线程按此平分。
     }
     with PhaseTimer(metrics, "load_backend", labels=phase_labels, enabled=profile):
         backend = create_transcriber(backend_name, **backend_kwargs)
@@ -1,6 +1,7 @@
 """命令行入口，负责解析参数并调用并发管线。"""  # 模块说明。
 import os
 import argparse  # 导入 argparse 以解析命令行参数。
+from functools import lru_cache  # 导入 lru_cache 以复用已构建的解析器。
 import logging
 import sys  # 导入 sys 以支持通过 python -m 调用。
 import platform  # 导入 platform 以按需选择默认 profile。
@@ -38,8 +39,9 @@ def parse_bool(value: str) -> bool:
     raise argparse.ArgumentTypeError("Expected 'true' or 'false'")  # 其他值抛出错误。
 
 
+@lru_cache(maxsize=1)
 def build_parser() -> argparse.ArgumentParser:
-    """创建参数解析器并声明所有可用选项。"""  # 函数说明。
+    """创建参数解析器并声明所有可用选项（解析器无状态，构建一次后复用）。"""  # 函数说明。
 
     parser = argparse.ArgumentParser(
         description="ASRProgram Round 13 transcription pipeline",
@@ -3,6 +3,8 @@
 import os
 # 导入 subprocess 以调用外部 ffprobe 命令获取音频时长。
 import subprocess
+# 导入 lru_cache 以缓存 ffprobe 探测结果。
+from functools import lru_cache
 # 导入 typing.Optional 作为类型注释，便于返回类型说明。
 from typing import Optional
 
@@ -27,9 +29,28 @@ def is_audio_path(path: str | os.PathLike[str], allowed_exts: Optional[list[str]
 
 # 定义通过 ffprobe 探测音频时长的函数。
 def probe_duration(path: str | os.PathLike[str]) -> float:
-    """调用 ffprobe 获取音频持续时间（单位：秒）。"""
+    """调用 ffprobe 获取音频持续时间（单位：秒），同一文件未变化时复用上次结果。"""
     # 将路径转换为字符串，确保 ffprobe 能处理包含空格或非 ASCII 的路径。
     string_path = os.fspath(path)
+    try:
+        # 以修改时间与大小识别文件是否变化，内容改写后缓存自然失效。
+        stat_result = os.stat(string_path)
+    except OSError:
+        # 无法 stat 时不缓存，交由 ffprobe 给出结果（通常为 0.0）。
+        return _run_ffprobe(string_path)
+    return _probe_duration_cached(string_path, stat_result.st_mtime_ns, stat_result.st_size)
+
+
+# 按 (路径, mtime_ns, size) 缓存探测结果，避免对同一文件重复派生 ffprobe 子进程。
+@lru_cache(maxsize=1024)
+def _probe_duration_cached(string_path: str, mtime_ns: int, size: int) -> float:
+    """缓存层，键中的 mtime_ns 与 size 仅用于失效判断。"""
+    return _run_ffprobe(string_path)
+
+
+# 实际调用 ffprobe 的内部函数。
+def _run_ffprobe(string_path: str) -> float:
+    """执行 ffprobe 并解析时长，失败时返回 0.0。"""
     # 构造 ffprobe 命令：只输出 duration 字段，避免冗余日志。
     command = [
         "ffprobe",
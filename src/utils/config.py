@@ -4,12 +4,11 @@ from __future__ import annotations  # 启用前向注解以提升类型兼容性
 import copy  # 导入 copy 以执行深拷贝避免引用共享。
 import os  # 导入 os 以访问环境变量与路径扩展。
 from dataclasses import dataclass  # 导入 dataclass 以封装结果结构。
+from functools import lru_cache  # 导入 lru_cache 以缓存 YAML 解析结果。
 from datetime import datetime, timezone  # 导入 datetime 用于生成时间戳。
 from pathlib import Path  # 导入 Path 统一路径处理。
 from typing import Any, Dict, Iterable, Mapping  # 导入类型注解辅助代码可读性。
 
-import yaml  # 导入 PyYAML 以读取/写出 YAML 文件。
-
 from src.utils.io import atomic_write_text  # 复用原子写入工具以保存配置快照。
 
 ENV_PREFIX = "ASRPROGRAM_"  # 所有环境变量需以此前缀开头才会被解析。
@@ -35,12 +34,25 @@ def _project_root() -> Path:
     return Path(__file__).resolve().parents[2]  # config.py 位于 src/utils，下两级即仓库根。
 
 
+@lru_cache(maxsize=8)
+def _parse_yaml_cached(path_str: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """按 (路径, mtime, 大小) 缓存 YAML 解析结果，文件变更后自动失效。"""  # 工具函数说明。
+
+    import yaml  # 延迟导入 PyYAML，仅在缓存未命中、需要真正解析时加载。
+
+    # 优先使用 libyaml 提供的 C 实现加载器；未编译 libyaml 的环境回退到纯 Python 的 SafeLoader，语义一致。
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(path_str, "r", encoding="utf-8") as handle:  # 打开文件读取 UTF-8 文本。
+        data = yaml.load(handle, Loader=loader)  # 使用安全加载器避免执行任意代码。
+    return data or {}  # 若文件为空则返回空字典以便后续处理。
+
+
 def _load_yaml(path: Path) -> Dict[str, Any]:
     """读取 YAML 文件并返回字典结构，若为空则返回空字典。"""  # 工具函数说明。
 
-    with path.open("r", encoding="utf-8") as handle:  # 打开文件读取 UTF-8 文本。
-        data = yaml.safe_load(handle)  # 使用 safe_load 避免执行任意代码。
-    return data or {}  # 若文件为空则返回空字典以便后续处理。
+    stat_result = path.stat()  # 读取元数据作为缓存键，避免重复解析未变化的文件。
+    cached = _parse_yaml_cached(str(path), stat_result.st_mtime_ns, stat_result.st_size)  # 命中缓存时跳过磁盘读取与解析。
+    return copy.deepcopy(cached)  # 返回独立副本，调用方可安全修改。
 
 
 def _initialize_sources(node: Any, label: str) -> Any:
@@ -291,6 +303,15 @@ def _validate_config(config: Dict[str, Any], sources: Dict[str, Any]) -> None:
             temperature,
             sources,
         )
+    vad_threshold = runtime.get("vad_threshold")  # 读取 VAD 阈值。
+    if vad_threshold is not None:  # 允许空值。
+        _assert_condition(
+            isinstance(vad_threshold, (int, float)) and 0.0 <= float(vad_threshold) <= 1.0,  # 概率阈值限制在 [0, 1]。
+            ["runtime", "vad_threshold"],
+            "vad_threshold must be within [0, 1]",
+            vad_threshold,
+            sources,
+        )
     threads = runtime.get("whisper_cpp", {}).get("threads")  # 读取 whisper.cpp 线程数。
     if threads is not None:  # 允许空值。
         _assert_condition(
@@ -356,8 +377,7 @@ def load_and_merge_config(
     default_path = root / "config" / "default.yaml"  # 构造默认配置路径。
     if not default_path.exists():  # 若默认文件缺失则立刻报错。
         raise FileNotFoundError(f"Default config not found: {default_path}")  # 抛出异常提醒缺失。
-    base_config = _load_yaml(default_path)  # 读取默认配置。
-    config = copy.deepcopy(base_config)  # 拷贝初始配置以便后续层叠覆盖。
+    config = _load_yaml(default_path)  # 读取默认配置（已是独立副本，可直接层叠覆盖）。
     sources = _initialize_sources(config, f"default:{default_path}")  # 初始化来源树。
     user_path = Path(config_path) if config_path else root / "config" / "user.yaml"  # 推导用户配置路径。
     user_config = {}  # 初始化用户配置字典。
@@ -414,6 +434,8 @@ def load_and_merge_config(
 def render_effective_config(bundle: ConfigBundle, include_sources: bool = True) -> str:
     """将配置与来源以 YAML 文本渲染，可附带来源注释。"""  # 导出函数说明。
 
+    import yaml  # 延迟导入 PyYAML，仅在渲染快照时加载。
+
     def _render(node: Any, source_node: Any, indent: int) -> list[str]:  # 定义内部递归渲染函数。
         lines: list[str] = []  # 当前层级的输出行集合。
         if isinstance(node, dict):  # 字典需要逐键展开。
@@ -32,20 +32,17 @@ PUNCT_MAP = {  # noqa: RUF012
     "＆": "&",  # 全角与符映射为半角。
     "＊": "*",  # 全角星号映射为半角。
 }
+# 基于映射表预构建 str.translate 转换表，供 normalize_punct 复用。 
+_PUNCT_TABLE = str.maketrans(PUNCT_MAP)
 
 
 def normalize_punct(text: str) -> str:
     """将文本中的常见全角标点替换为半角形式，保持其他字符不变。"""  # 函数说明。
-    # 若输入为空字符串，则直接返回，避免后续遍历引入开销。
-    if not text:
+    # 空输入或纯 ASCII 文本不含映射表中的全角字符，直接返回以跳过扫描。
+    if not text or text.isascii():
         return text
-    # 逐字符替换，构造新的字符列表以提高性能。
-    normalized_chars = []
-    for char in text:
-        # 使用映射表替换字符，若不存在映射则返回原字符。
-        normalized_chars.append(PUNCT_MAP.get(char, char))
-    # 将字符列表重新组合为字符串并返回。
-    return "".join(normalized_chars)
+    # 使用预构建的转换表在 C 层单次扫描完成替换。
+    return text.translate(_PUNCT_TABLE)
 
 
 # 定义用于识别连续 ASCII 字母与数字的正则表达式。
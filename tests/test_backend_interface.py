@@ -3,6 +3,8 @@
 import importlib
 # 导入 pathlib.Path 以便创建临时文件路径。
 from pathlib import Path
+# 导入 subprocess 以在干净的解释器中检查模块导入情况。
+import subprocess
 # 导入 sys 以将仓库根目录加入模块搜索路径。
 import sys
 
@@ -56,3 +58,29 @@ def test_registered_backends_return_standard_structure(tmp_path):
     # faster-whisper 本轮不返回词级时间戳，因此 words 应为空列表。
     assert faster_result["words"] == []
 
+
+# 验证注册表按需导入，使用 dummy 时不会加载其他后端模块。
+def test_dummy_backend_does_not_import_other_backends():
+    """在独立解释器中创建 dummy 后端，确认 faster-whisper 后端模块未被导入。"""
+    # 在子进程中执行，避免受其他测试已导入模块的影响。
+    probe = (
+        "import sys\n"
+        "from src.asr.backends import create_transcriber\n"
+        "create_transcriber('dummy')\n"
+        "print('src.asr.backends.faster_whisper_backend' in sys.modules)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", probe],
+        cwd=Path(__file__).resolve().parents[1],
+        check=True,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    assert result.stdout.strip() == "False"
+
+
+# 验证未知后端名称会给出包含可选项的错误。
+def test_unknown_backend_lists_available_options():
+    """未注册的后端名称应抛出 ValueError 并列出可用后端。"""
+    with pytest.raises(ValueError, match="dummy, faster-whisper"):
+        create_transcriber("missing")
@@ -0,0 +1,30 @@
+"""验证环境体检脚本的导入开销保持轻量。"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+PROBE = """
+import importlib.util
+import sys
+
+spec = importlib.util.spec_from_file_location("verify_env", sys.argv[1])
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+print(",".join(name for name in ("yaml", "inspect", "src.utils.config") if name in sys.modules))
+"""
+
+
+def test_import_does_not_load_heavy_modules() -> None:
+    """仅导入 verify_env 时不应加载 yaml、inspect 或配置加载器。"""
+
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE, str(ROOT / "scripts" / "verify_env.py")],
+        cwd=ROOT,
+        check=True,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    assert result.stdout.strip() == ""
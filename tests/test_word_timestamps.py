@@ -10,7 +10,7 @@ import pytest  # noqa: F401
 # 从管线模块导入 run 函数与内部工具以便测试单调性逻辑。
 from src.asr import pipeline  # noqa: F401
 # 导入 faster-whisper 后端类以测试降级分词函数。
-from src.asr.backends.faster_whisper_backend import FasterWhisperTranscriber  # noqa: F401
+from src.asr.backends.faster_whisper_backend import FasterWhisperTranscriber, _resolve_compute_type  # noqa: F401
 
 
 class DummyBackend:  # noqa: D401
@@ -132,3 +132,162 @@ def test_fallback_for_cjk_characters():
     assert pytest.approx(words[0]["start"], abs=1e-6) == 0.0
     assert pytest.approx(words[-1]["end"], abs=1e-6) == 2.0
     assert clipped is False
+
+
+def test_auto_compute_type_resolves_per_device():
+    """compute_type=auto 应按设备解析为 int8 系列，显式取值保持不变。"""  # 测试说明。
+    assert _resolve_compute_type("cpu", "auto") == "int8"
+    assert _resolve_compute_type("cuda", "auto") == "int8_float16"
+    assert _resolve_compute_type("cuda", "float16") == "float16"
+
+
+def test_whisper_model_cache_reuses_instances():
+    """相同 (模型, 设备, 精度) 组合应复用同一个模型实例。"""  # 测试说明。
+    from src.asr.backends import faster_whisper_backend as fw_backend
+
+    FasterWhisperTranscriber.clear_model_cache()
+    loads = []
+
+    def fake_model(path, device, compute_type, cpu_threads, num_workers):
+        loads.append((path, device, compute_type, cpu_threads, num_workers))
+        return object()
+
+    first = fw_backend._load_whisper_model(fake_model, "tiny", "cpu", "int8")
+    second = fw_backend._load_whisper_model(fake_model, "tiny", "cpu", "int8")
+    third = fw_backend._load_whisper_model(fake_model, "tiny", "cpu", "float32")
+    assert first is second
+    assert third is not first
+    assert len(loads) == 2
+    FasterWhisperTranscriber.clear_model_cache()
+
+
+def test_cpu_threads_split_across_workers(monkeypatch):
+    """未显式指定时按 worker 数平分核心，环境变量可固定线程数。"""  # 测试说明。
+    from src.asr.backends import faster_whisper_backend as fw_backend
+
+    monkeypatch.delenv(fw_backend.CPU_THREADS_ENV, raising=False)
+    monkeypatch.setattr(fw_backend.os, "sched_getaffinity", lambda pid: set(range(8)), raising=False)
+    assert fw_backend._resolve_cpu_threads(None, 1) == 8
+    assert fw_backend._resolve_cpu_threads(None, 3) == 2
+    assert fw_backend._resolve_cpu_threads(4, 2) == 4
+    monkeypatch.setenv(fw_backend.CPU_THREADS_ENV, "1")
+    assert fw_backend._resolve_cpu_threads(None, 1) == 1
+
+
+def _stub_transcriber(monkeypatch, segments):
+    """构造不加载真实模型的 faster-whisper 后端，transcribe() 返回给定段对象。"""  # 辅助函数说明。
+    from dataclasses import asdict
+    from types import SimpleNamespace
+
+    from src.asr.backends import faster_whisper_backend as fw_backend
+
+    monkeypatch.setattr(fw_backend, "probe_duration", lambda path: 3.0)
+    backend = object.__new__(FasterWhisperTranscriber)
+    backend.model_name = "tiny"
+    backend.language = "en"
+    backend.extra_options = {}
+    backend.faster_whisper_version = "test"
+    backend.model_path_or_name = "tiny"
+    backend.device = "cpu"
+    backend.compute_type = "int8"
+    backend.release_memory = False
+    backend.decode_options = fw_backend.DecodeOptions(5, 0.0, False, None, None, None)
+    backend._decode_options_dict = asdict(backend.decode_options)
+    backend._transcribe_kwargs = {"beam_size": 5, "word_timestamps": True}
+    backend._model = SimpleNamespace(
+        transcribe=lambda path, **kwargs: (iter(segments), SimpleNamespace(language="en"))
+    )
+    return backend
+
+
+def test_transcribe_file_normalizes_words(tmp_path: Path, monkeypatch):
+    """词时间应被裁剪到段内且单调，空词被跳过后索引仍连续。"""  # 测试说明。
+    from types import SimpleNamespace
+
+    word = lambda text, start, end, prob: SimpleNamespace(word=text, start=start, end=end, probability=prob)  # noqa: E731
+    segments = [
+        SimpleNamespace(
+            id=0,
+            start=0.0,
+            end=1.0,
+            text=" hello , world",
+            avg_logprob=-0.1,
+            words=[word(" hello", -0.2, 0.5, 0.9), word(" ", 0.5, 0.5, 0.1), word(" world", 0.4, 1.3, 0.7)],
+        ),
+        SimpleNamespace(id=1, start=1.0, end=2.0, text=" fallback text", avg_logprob=-0.2, words=[]),
+    ]
+    audio = tmp_path / "clip.wav"
+    audio.write_bytes(b"fake")
+    result = _stub_transcriber(monkeypatch, segments).transcribe_file(str(audio))
+    first, second = result["segments"]
+    assert [(w["text"], w["start"], w["end"], w["index"]) for w in first["words"]] == [
+        ("hello", 0.0, 0.5, 0),
+        ("world", 0.5, 1.0, 1),
+    ]
+    assert first["avg_conf"] == pytest.approx(0.8)
+    assert [w["text"] for w in second["words"]] == ["fallback", "text"]
+    assert second["words"][-1]["end"] == pytest.approx(2.0)
+    assert len(result["words"]) == 4
+    assert result["meta"]["word_time_clipped_segments"] == [0]
+    assert result["meta"]["word_fallback_segments"] == [1]
+    assert result["meta"]["decode_options"]["beam_size"] == 5
+
+
+def test_transcribe_files_yields_results_in_input_order(tmp_path: Path, monkeypatch):
+    """批量接口应按输入顺序产出结果；解码器未给出时长时回退到各自的 ffprobe 探测。"""  # 测试说明。
+    from types import SimpleNamespace
+
+    from src.asr.backends import faster_whisper_backend as fw_backend
+
+    segments = [SimpleNamespace(id=0, start=0.0, end=1.0, text=" hi", avg_logprob=None, words=[])]
+    backend = _stub_transcriber(monkeypatch, segments)
+    durations = {"a.wav": 1.5, "b.wav": 2.5}
+    monkeypatch.setattr(fw_backend, "probe_duration", lambda path: durations[Path(path).name])
+    paths = []
+    for name in durations:
+        audio = tmp_path / name
+        audio.write_bytes(b"fake")
+        paths.append(str(audio))
+    results = list(backend.transcribe_files(paths))
+    assert [result["duration_sec"] for result in results] == [1.5, 2.5]
+    assert results[0]["meta"]["duration_source"] == "ffprobe"
+
+
+def test_decoder_duration_skips_ffprobe(tmp_path: Path, monkeypatch):
+    """解码器提供时长时不应调用 ffprobe。"""  # 测试说明。
+    from types import SimpleNamespace
+
+    from src.asr.backends import faster_whisper_backend as fw_backend
+
+    segments = [SimpleNamespace(id=0, start=0.0, end=1.0, text=" hi", avg_logprob=None, words=[])]
+    backend = _stub_transcriber(monkeypatch, segments)
+    backend._model = SimpleNamespace(
+        transcribe=lambda path, **kwargs: (iter(segments), SimpleNamespace(language="en", duration=4.25))
+    )
+
+    def fail_probe(path):
+        raise AssertionError("ffprobe should not run")
+
+    monkeypatch.setattr(fw_backend, "probe_duration", fail_probe)
+    audio = tmp_path / "clip.wav"
+    audio.write_bytes(b"fake")
+    result = backend.transcribe_file(str(audio))
+    assert result["duration_sec"] == 4.25
+    assert result["meta"]["duration_source"] == "decoder"
+
+
+def test_fast_mode_switches_to_greedy_decoding(monkeypatch):
+    """快速模式应覆盖为贪心解码并关闭前文条件。"""  # 测试说明。
+    import sys
+    from types import SimpleNamespace
+
+    fake_module = SimpleNamespace(WhisperModel=lambda *args, **kwargs: object(), __version__="test")
+    monkeypatch.setitem(sys.modules, "faster_whisper", fake_module)
+    FasterWhisperTranscriber.clear_model_cache()
+    backend = FasterWhisperTranscriber(model="tiny", device="cpu", compute_type="int8", fast_mode=True)
+    FasterWhisperTranscriber.clear_model_cache()
+    assert backend._transcribe_kwargs["beam_size"] == 1
+    assert backend._transcribe_kwargs["best_of"] == 1
+    assert "patience" not in backend._transcribe_kwargs
+    assert backend._transcribe_kwargs["condition_on_previous_text"] is False
+    assert backend._decode_options_dict["fast_mode"] is True